@@ -4,7 +4,11 @@ import os
 if __name__ == "__main__":
     # Ensure we are in the project root
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Launch Streamlit app
-    os.system("streamlit run src/ui/app.py")
 
+    # Launch the Streamlit app in-process. This is what the `streamlit run`
+    # CLI does internally, minus the extra shell + interpreter start-up.
+    from streamlit.web import bootstrap
+
+    flag_options = {}
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run("src/ui/app.py", is_hello=False, args=[], flag_options=flag_options)
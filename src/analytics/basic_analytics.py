@@ -1,12 +1,16 @@
 # src/analytics/basic_analytics.py
 import streamlit as st
-import statistics
 
 
-def basic_analytics_section(indexed_apps):
+def basic_analytics_section(app_stats):
     """
     Section 6: basic statistics (min, max, average, median)
-    on the same 2,000-row subset. Uses session_state so results stay.
+    on the same 2,000-row subset.
+
+    `app_stats` maps each metric to its summary dict (or None when the
+    metric has no values). It is computed once, when the index is built,
+    by indexed_engine.build_applications_engine(), so this section only
+    displays results.
     """
     st.divider()
     st.header("6. Basic analytics (subset of 2,000 apps)")
@@ -18,10 +22,17 @@ def basic_analytics_section(indexed_apps):
         """
     )
 
-    if "analytics_summary" not in st.session_state:
-        st.session_state.analytics_summary = None
-        st.session_state.analytics_metric_key = None
+    _metric_summary(app_stats)
+
 
+@st.fragment
+def _metric_summary(app_stats):
+    """
+    Metric picker + the selected metric's stats.
+
+    A fragment: changing the selectbox reruns only this function instead of
+    the whole app script (loading, engine lookups, graph explorer, ...).
+    """
     metric_label = st.selectbox(
         "Choose metric to analyze:",
         [
@@ -39,46 +50,20 @@ def basic_analytics_section(indexed_apps):
     else:
         metric_key = "recommendations_total"
 
-    if st.button("Compute analytics", key="btn_compute_analytics"):
-        values = [
-            rec.get(metric_key)
-            for rec in indexed_apps
-            if rec.get(metric_key) is not None
-        ]
+    # Stats are precomputed, so render the selected metric directly
+    summary = app_stats.get(metric_key)
 
-        if not values:
-            st.warning(f"No non-empty values found for '{metric_key}'.")
-            st.session_state.analytics_summary = None
-            st.session_state.analytics_metric_key = None
-        else:
-            values = [float(v) for v in values]
+    if summary is None:
+        st.warning(f"No non-empty values found for '{metric_key}'.")
+        return
 
-            min_val = min(values)
-            max_val = max(values)
-            avg_val = sum(values) / len(values)
-            median_val = statistics.median(values)
-
-            st.session_state.analytics_summary = {
-                "min": min_val,
-                "max": max_val,
-                "avg": avg_val,
-                "median": median_val,
-                "count": len(values),
-            }
-            st.session_state.analytics_metric_key = metric_key
-
-    # Always show last computed analytics
-    summary = st.session_state.analytics_summary
-    metric_key_shown = st.session_state.analytics_metric_key
-
-    if summary is not None and metric_key_shown is not None:
-        st.success(
-            f"Computed statistics for {summary['count']} records "
-            f"on metric '{metric_key_shown}'."
-        )
+    st.success(
+        f"Computed statistics for {summary['count']} records "
+        f"on metric '{metric_key}'."
+    )
 
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Min", f"{summary['min']:.2f}")
-        col2.metric("Max", f"{summary['max']:.2f}")
-        col3.metric("Average", f"{summary['avg']:.2f}")
-        col4.metric("Median", f"{summary['median']:.2f}")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Min", f"{summary['min']:.2f}")
+    col2.metric("Max", f"{summary['max']:.2f}")
+    col3.metric("Average", f"{summary['avg']:.2f}")
+    col4.metric("Median", f"{summary['median']:.2f}")
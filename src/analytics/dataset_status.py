@@ -2,6 +2,22 @@
 import streamlit as st
 
 
+# cleaned_data is the shared object returned by the cached load_clean_data,
+# so it is keyed by identity; the summary is rebuilt only when data reloads.
+@st.cache_data(hash_funcs={dict: id}, show_spinner=False)
+def _dataset_summary(cleaned_data):
+    """{"Table": [...], "Number of rows": [...]} for the loaded tables."""
+    tables, counts = [], []
+    for name, rows in cleaned_data.items():
+        try:
+            n_rows = len(rows)
+        except TypeError:
+            n_rows = "?"
+        tables.append(name)
+        counts.append(n_rows)
+    return {"Table": tables, "Number of rows": counts}
+
+
 def show_dataset_status(cleaned_data):
     """
     Section 1: show which tables we loaded and how many rows each has.
@@ -9,18 +25,5 @@ def show_dataset_status(cleaned_data):
     st.divider()
     st.header("1. Dataset Status")
 
-    summary_rows = []
-    for name, rows in cleaned_data.items():
-        try:
-            n_rows = len(rows)
-        except TypeError:
-            n_rows = "?"
-        summary_rows.append((name, n_rows))
-
     st.write("**Tables loaded:**")
-    st.table(
-        {
-            "Table": [name for name, _ in summary_rows],
-            "Number of rows": [n for _, n in summary_rows],
-        }
-    )
+    st.dataframe(_dataset_summary(cleaned_data), hide_index=True)
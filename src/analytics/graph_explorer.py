@@ -1,4 +1,4 @@
-# src/ui/graph_explorer.py
+# src/analytics/graph_explorer.py
 
 """Streamlit component for exploring the developer–publisher graph.
 
@@ -9,11 +9,21 @@ No external graph/plotting libraries are used.
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import heapq
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import streamlit as st
 
-from src.graph.graph_model import build_dev_pub_graph, Graph
+from src.graph.graph_model import (
+    build_dev_pub_graph,
+    dev_pub_slice,
+    Graph,
+    developer_with_most_publisher_collaborations,
+    get_publisher_collaborations_for_developer,
+)
 from src.graph.graph_algorithms import (
     bfs_traversal,
     dfs_traversal,
@@ -25,31 +35,29 @@ from src.graph.graph_algorithms import (
 # Cached graph builder
 # -------------------------------------------------------------
 
-@st.cache_resource
+# cleaned_data comes from the cached load_clean_data (one shared object per
+# load), so hash it by identity instead of walking every row on each rerun.
+@st.cache_resource(hash_funcs={dict: id})
 def _build_small_dev_pub_graph(
     cleaned_data: Dict[str, list],
     max_devs: int = 150,
     max_pubs: int = 150,
     max_links: int = 5000,
-) -> Tuple[Graph, Dict[str, Graph.Vertex], Dict[str, Graph.Vertex]]:
+) -> Tuple[
+    Graph,
+    Dict[int, Graph.Vertex],
+    Dict[str, Graph.Vertex],
+    Dict[str, Graph.Vertex],
+    List[str],
+    List[str],
+]:
     """Build a *small* bipartite developer–publisher graph.
 
     We limit how many rows we use so that the UI stays fast. You can
     safely increase these numbers later if performance is still OK.
     """
 
-    developers = cleaned_data.get("developers", [])[:max_devs]
-    publishers = cleaned_data.get("publishers", [])[:max_pubs]
-    app_devs = cleaned_data.get("application_developers", [])[:max_links]
-    app_pubs = cleaned_data.get("application_publishers", [])[:max_links]
-
-    slim = {
-        "developers": developers,
-        "publishers": publishers,
-        "application_developers": app_devs,
-        "application_publishers": app_pubs,
-    }
-
+    slim = dev_pub_slice(cleaned_data, max_devs, max_pubs, max_links)
     graph, dev_vertices, pub_vertices = build_dev_pub_graph(slim)
 
     # Build name -> vertex maps for easy selection in the UI
@@ -67,21 +75,260 @@ def _build_small_dev_pub_graph(
         if name:
             pub_by_name[name] = v
 
-    return graph, dev_by_name, pub_by_name
+    # Selectbox options, sorted once here instead of on every rerun
+    dev_names = sorted(dev_by_name)
+    pub_names = sorted(pub_by_name)
+
+    return graph, dev_vertices, dev_by_name, pub_by_name, dev_names, pub_names
+
+
+# -------------------------------------------------------------
+# Cached graph statistics
+# -------------------------------------------------------------
+
+# The graph itself comes from @st.cache_resource, so it never changes between
+# reruns and id(graph) is a stable cache key. The leading underscore tells
+# Streamlit not to hash the (large) graph object.
+
+# Rows of the summary tab's "most connected" table
+TOP_DEGREE_ROWS = 15
+
+
+@st.cache_resource(show_spinner=False)
+def _components_cached(graph_id: int, _graph: Graph):
+    """Connected components (largest first), their sizes, a
+    {id(vertex): component #} map so a vertex's component is an O(1) lookup,
+    and the TOP_DEGREE_ROWS highest-degree (degree, vertex) pairs.
+
+    Component numbers are 1-based ranks by size, matching the
+    "Component #" column of the size distribution table. The top degrees
+    live here rather than in session_state so all sessions share one copy
+    and it always belongs to the same graph as comp_of; the summary tab
+    does no per-vertex work on a rerun.
+    """
+    comps = sorted(connected_components(_graph), key=len, reverse=True)
+    comp_sizes = [len(c) for c in comps]
+    comp_of = {id(v): ci for ci, comp in enumerate(comps, start=1) for v in comp}
+    degree = _graph.degree
+    top_degree = heapq.nlargest(
+        TOP_DEGREE_ROWS, ((degree(v), v) for v in _graph.vertices()), key=itemgetter(0)
+    )
+    return comps, comp_sizes, comp_of, top_degree
+
+
+# -------------------------------------------------------------
+# FULL DATASET (FAST) helpers: no graph build required
+# -------------------------------------------------------------
+
+# Read-only lookups used on every rerun; built once per loaded dataset.
+@st.cache_resource(hash_funcs={dict: id}, show_spinner=False)
+def _build_id_name_maps(cleaned_data: Dict[str, list]) -> Tuple[Dict[int, str], Dict[int, str]]:
+    dev_name_by_id: Dict[int, str] = {}
+    for row in cleaned_data.get("developers", []):
+        did = row.get("id")
+        if did is not None:
+            dev_name_by_id[int(did)] = row.get("name") or f"Developer #{did}"
+
+    pub_name_by_id: Dict[int, str] = {}
+    for row in cleaned_data.get("publishers", []):
+        pid = row.get("id")
+        if pid is not None:
+            pub_name_by_id[int(pid)] = row.get("name") or f"Publisher #{pid}"
+
+    return dev_name_by_id, pub_name_by_id
+
+
+def _link_pairs(rows: list, id_key: str) -> np.ndarray:
+    """
+    Unique (appid, id_key) pairs of one link table as an (n, 2) int64 array,
+    sorted by appid then id. Rows with a missing id are skipped.
+    """
+    flat = np.fromiter(
+        (
+            v
+            for row in rows
+            if row.get("appid") is not None and row.get(id_key) is not None
+            for v in (row["appid"], row[id_key])
+        ),
+        dtype=np.int64,
+    )
+    if not flat.size:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(flat.reshape(-1, 2), axis=0)
+
+
+# cleaned_data is the shared object from the cached load_clean_data, so it is
+# hashed by identity; the link tables are converted once per loaded dataset.
+@st.cache_resource(hash_funcs={dict: id}, show_spinner=False)
+def _build_link_arrays(
+    cleaned_data: Dict[str, list],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (ad_app, ad_dev, ap_app, ap_pub): the developer and publisher link tables
+    as de-duplicated int64 columns, each pair sorted by appid.
+    """
+    ad = _link_pairs(cleaned_data.get("application_developers", []), "developer_id")
+    ap = _link_pairs(cleaned_data.get("application_publishers", []), "publisher_id")
+    return ad[:, 0], ad[:, 1], ap[:, 0], ap[:, 1]
+
+
+def _csr(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group values by key: (unique_keys, ptr, grouped_values) where the values
+    of unique_keys[i] are grouped_values[ptr[i]:ptr[i + 1]], in ascending order.
+    """
+    order = np.lexsort((values, keys))
+    keys_sorted = keys[order]
+    unique_keys = np.unique(keys_sorted)
+    ptr = np.append(np.searchsorted(keys_sorted, unique_keys), keys_sorted.size)
+    return unique_keys, ptr, values[order]
+
+
+def _csr_row(index: Tuple[np.ndarray, np.ndarray, np.ndarray], key: int) -> np.ndarray:
+    """Values grouped under key by _csr (a view; empty when key is absent)."""
+    unique_keys, ptr, grouped = index
+    i = int(np.searchsorted(unique_keys, key))
+    if i == unique_keys.size or unique_keys[i] != key:
+        return grouped[:0]
+    return grouped[ptr[i]:ptr[i + 1]]
+
+
+def _csr_gather(
+    index: Tuple[np.ndarray, np.ndarray, np.ndarray], keys: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rows of _csr's index for several keys at once: (owner_key, value) per
+    grouped value, keys absent from the index contributing nothing.
+    """
+    unique_keys, ptr, grouped = index
+    pos = np.searchsorted(unique_keys, keys)
+    found = pos < unique_keys.size
+    found[found] = unique_keys[pos[found]] == keys[found]
+    pos, keys = pos[found], keys[found]
+
+    starts, counts = ptr[pos], ptr[pos + 1] - ptr[pos]
+    # start of each segment repeated over it, plus the offset within it
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(keys, counts), grouped[np.repeat(starts, counts) + offsets]
+
+
+@st.cache_resource(hash_funcs={dict: id}, show_spinner=False)
+def _build_dev_to_apps(cleaned_data: Dict[str, list]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Inverted developer -> appids index over the developer link arrays."""
+    ad_app, ad_dev, _, _ = _build_link_arrays(cleaned_data)
+    return _csr(ad_dev, ad_app)
+
+
+@st.cache_resource(hash_funcs={dict: id}, show_spinner=False)
+def _build_app_to_pubs(cleaned_data: Dict[str, list]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """App -> publisher ids index over the publisher link arrays."""
+    _, _, ap_app, ap_pub = _build_link_arrays(cleaned_data)
+    return _csr(ap_app, ap_pub)
+
+
+def _compute_top_developer_full_dataset(
+    ad_app: np.ndarray,
+    ad_dev: np.ndarray,
+    app_to_pubs: Tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> Tuple[Optional[int], int]:
+    """
+    Fast top developer: totals[dev_id] = sum over apps of (#publishers on that app),
+    where dev_id is listed on that app.
+
+    The link arrays are already de-duplicated, so nothing is double counted.
+    Ties go to the smallest developer id (argmax over ids in ascending order),
+    so the answer does not depend on row or hash order.
+    """
+    pub_apps, ptr, _ = app_to_pubs
+    pub_counts = np.diff(ptr)
+    if not pub_apps.size or not ad_app.size:
+        return None, 0
+
+    # publisher count of each (app, dev) row's app; 0 when the app has none
+    pos = np.minimum(np.searchsorted(pub_apps, ad_app), pub_apps.size - 1)
+    weights = np.where(pub_apps[pos] == ad_app, pub_counts[pos], 0)
+
+    devs, dev_inverse = np.unique(ad_dev, return_inverse=True)
+    totals = np.bincount(dev_inverse, weights=weights, minlength=devs.size)
+    best = int(np.argmax(totals))
+    if totals[best] <= 0:
+        return None, 0
+    return int(devs[best]), int(totals[best])
+
+
+def _compute_publisher_collabs_for_developer_full_dataset(
+    dev_to_apps: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    app_to_pubs: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    developer_id: int,
+    sample_k_appids: int = 10,
+) -> List[Tuple[int, int, List[int]]]:
+    """
+    Returns list of (publisher_id, weight, sample_appids) for ONE developer_id.
+    weight counts unique apps shared with that publisher.
+
+    The developer's apps come from the dev_to_apps index and their publishers
+    are slices of app_to_pubs, so the work is proportional to the developer's
+    links rather than to the size of either link table.
+    """
+    apps_with_dev = _csr_row(dev_to_apps, int(developer_id))
+    hit_apps, hit_pubs = _csr_gather(app_to_pubs, apps_with_dev)
+    if not hit_pubs.size:
+        return []
+
+    # dense per-publisher-id counts; publisher ids are non-negative ints
+    weights = np.bincount(hit_pubs)
+    pubs = np.flatnonzero(weights)
+    weights = weights[pubs]
+
+    # stable sort keeps each publisher's appids in ascending order
+    apps_sorted = hit_apps[np.argsort(hit_pubs, kind="stable")]
+    starts = np.cumsum(weights) - weights
+
+    return [
+        (int(pubs[i]), int(weights[i]), apps_sorted[starts[i]:starts[i] + min(weights[i], sample_k_appids)].tolist())
+        for i in np.argsort(-weights, kind="stable")
+    ]
+
+
+# The results are small and deterministic in the loaded dataset, so repeated
+# button presses (and reruns from other widgets) are served from the cache.
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, hash_funcs={dict: id})
+def _top_developer_full_dataset(cleaned_data: Dict[str, list]) -> Tuple[Optional[int], int]:
+    ad_app, ad_dev, _, _ = _build_link_arrays(cleaned_data)
+    return _compute_top_developer_full_dataset(ad_app, ad_dev, _build_app_to_pubs(cleaned_data))
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, hash_funcs={dict: id})
+def _publisher_collabs_full_dataset(
+    cleaned_data: Dict[str, list],
+    developer_id: int,
+    sample_k_appids: int = 10,
+) -> List[Tuple[int, int, List[int]]]:
+    return _compute_publisher_collabs_for_developer_full_dataset(
+        _build_dev_to_apps(cleaned_data), _build_app_to_pubs(cleaned_data), developer_id,
+        sample_k_appids=sample_k_appids,
+    )
 
 
 # -------------------------------------------------------------
 # Helper for pretty vertex labels
 # -------------------------------------------------------------
 
+# Memoized on hashable primitives rather than on the Vertex itself, so the
+# cache does not pin vertices of old graphs in memory and equal labels are
+# shared across graph rebuilds.
+@lru_cache(maxsize=4096)
+def _label_for(kind, vid, name) -> str:
+    if name:
+        return f"{kind.title()} – {name}"
+    if vid is not None:
+        return f"{kind.title()} #{vid}"
+    return f"Vertex(kind={kind})"
+
+
 def _vertex_label(v: Graph.Vertex) -> str:
     row = v.element() or {}
-    name = row.get("name")
-    if name:
-        return f"{v.kind().title()} – {name}"
-    if v.id() is not None:
-        return f"{v.kind().title()} #{v.id()}"
-    return f"Vertex(kind={v.kind()})"
+    return _label_for(v.kind(), v.id(), row.get("name"))
 
 
 # -------------------------------------------------------------
@@ -112,16 +359,21 @@ def render_graph_explorer(cleaned_data: Dict[str, list]) -> None:
         """
     )
 
+    dev_name_by_id, pub_name_by_id = _build_id_name_maps(cleaned_data)
+
     with st.spinner("Building a small developer–publisher graph from the dataset..."):
-        graph, dev_by_name, pub_by_name = _build_small_dev_pub_graph(cleaned_data)
+        graph, dev_vertices, dev_by_name, pub_by_name, dev_names, pub_names = (
+            _build_small_dev_pub_graph(cleaned_data)
+        )
 
     if graph.vertex_count() == 0:
         st.warning("Graph is empty – check that graph-related tables are loaded.")
         return
 
-    tab_dev, tab_pub, tab_summary = st.tabs([
+    tab_dev, tab_pub, tab_top, tab_summary = st.tabs([
         "Developer view",
         "Publisher view",
+        "Top collaborations",
         "Graph summary",
     ])
 
@@ -131,7 +383,6 @@ def render_graph_explorer(cleaned_data: Dict[str, list]) -> None:
     with tab_dev:
         st.subheader("Developer neighborhood & traversals")
 
-        dev_names = sorted(dev_by_name.keys())
         if not dev_names:
             st.warning("No developers found in the current graph slice.")
         else:
@@ -167,7 +418,6 @@ def render_graph_explorer(cleaned_data: Dict[str, list]) -> None:
     with tab_pub:
         st.subheader("Publisher neighborhood & traversals")
 
-        pub_names = sorted(pub_by_name.keys())
         if not pub_names:
             st.warning("No publishers found in the current graph slice.")
         else:
@@ -197,6 +447,118 @@ def render_graph_explorer(cleaned_data: Dict[str, list]) -> None:
             if show_dfs:
                 _render_traversal(graph, selected_pub, mode="dfs")
 
+    # ------------------------------------------------------------------
+    # Top collaborations
+    # ------------------------------------------------------------------
+    with tab_top:
+        st.subheader("Top developer by publisher collaborations")
+
+        st.write(
+            """
+            **Two modes:**
+            - **Slice mode:** uses the small graph built above (fast, supports BFS/DFS).
+            - **FULL dataset (fast):** computes using link tables directly (no graph build).
+            """
+        )
+
+        mode = st.radio(
+            "Choose computation mode:",
+            ["Slice graph mode", "FULL dataset (fast)"],
+            horizontal=True,
+            key="top_mode",
+        )
+
+        if mode == "Slice graph mode":
+            st.caption("Uses the graph slice shown in the other tabs.")
+
+            if st.button("Find top developer in this graph slice", key="top_dev_btn"):
+                top_dev, total = developer_with_most_publisher_collaborations(graph, dev_vertices)
+                st.session_state["top_dev_vertex"] = top_dev
+                st.session_state["top_dev_total"] = total
+                st.session_state["top_dev_collabs"] = (
+                    get_publisher_collaborations_for_developer(graph, top_dev) if top_dev else []
+                )
+
+            top_dev = st.session_state.get("top_dev_vertex")
+            if top_dev is not None:
+                st.success(f"Top developer: **{_vertex_label(top_dev)}**")
+                st.write(f"Total collaborations (sum of weights): **{st.session_state.get('top_dev_total', 0)}**")
+
+                collabs = st.session_state.get("top_dev_collabs", [])
+                _render_collaborations_table(collabs, title="Publishers collaborating with the top developer")
+
+            st.markdown("---")
+            st.subheader("Inspect collaborations for a chosen developer (slice mode)")
+
+            # dev_names: the cached, pre-sorted selectbox options
+            if not dev_names:
+                st.info("No developers available in this slice.")
+            else:
+                chosen_name = st.selectbox("Pick a developer:", dev_names, key="dev_collab_pick")
+                chosen_dev = dev_by_name[chosen_name]
+
+                if st.button("Show collaborations for this developer", key="dev_collab_btn"):
+                    st.session_state["manual_dev_vertex"] = chosen_dev
+                    st.session_state["manual_collabs"] = get_publisher_collaborations_for_developer(graph, chosen_dev)
+
+                manual_dev = st.session_state.get("manual_dev_vertex")
+                if manual_dev is not None:
+                    st.info(f"Developer: **{_vertex_label(manual_dev)}**")
+                    manual_collabs = st.session_state.get("manual_collabs", [])
+                    _render_collaborations_table(manual_collabs, title="Publishers collaborating with this developer")
+
+        else:
+            st.caption(
+                "Computes on the FULL dataset (fast) without creating a huge graph. "
+                "If several developers tie, the one with the smallest developer id is shown."
+            )
+
+            if st.button("Find top developer in FULL dataset", key="top_full_btn"):
+                top_did, total = _top_developer_full_dataset(cleaned_data)
+                st.session_state["full_top_did"] = top_did
+                st.session_state["full_top_total"] = total
+                st.session_state["full_top_pub_stats"] = (
+                    _publisher_collabs_full_dataset(cleaned_data, top_did)
+                    if top_did is not None else []
+                )
+
+            top_did = st.session_state.get("full_top_did")
+            if top_did is not None:
+                st.success(f"Top developer: **{dev_name_by_id.get(top_did, f'Developer #{top_did}')}**")
+                st.write(f"Total collaborations (sum of weights): **{st.session_state.get('full_top_total', 0)}**")
+
+                pub_stats = st.session_state.get("full_top_pub_stats", [])
+                _render_full_dataset_table(
+                    pub_stats,
+                    pub_name_by_id,
+                    title="Publishers collaborating with the top developer (FULL dataset)",
+                )
+            else:
+                st.info("Click the button above to compute the full-dataset top developer.")
+
+            st.markdown("---")
+            st.subheader("Inspect collaborations for a developer by ID (FULL dataset)")
+
+            dev_id_input = st.number_input("Developer ID:", min_value=0, value=0, step=1, key="full_dev_id")
+            sample_k = st.slider("Sample appids per publisher", 0, 20, 10, key="sample_k_full")
+
+            if st.button("Show FULL dataset collaborations for this developer", key="full_dev_btn"):
+                stats = _publisher_collabs_full_dataset(
+                    cleaned_data, int(dev_id_input), sample_k_appids=int(sample_k)
+                )
+                st.session_state["full_manual_stats"] = stats
+                st.session_state["full_manual_did"] = int(dev_id_input)
+
+            manual_stats = st.session_state.get("full_manual_stats")
+            manual_did = st.session_state.get("full_manual_did")
+            if manual_stats is not None and manual_did is not None:
+                st.info(f"Developer: **{dev_name_by_id.get(manual_did, f'Developer #{manual_did}')}**")
+                _render_full_dataset_table(
+                    manual_stats,
+                    pub_name_by_id,
+                    title="Publishers collaborating with this developer (FULL dataset)",
+                )
+
     # ------------------------------------------------------------------
     # Graph summary
     # ------------------------------------------------------------------
@@ -208,9 +570,8 @@ def render_graph_explorer(cleaned_data: Dict[str, list]) -> None:
 
         st.write(f"**Vertices:** {v_count}  |  **Edges:** {e_count}")
 
-        # Connected components
-        comps = connected_components(graph)
-        comp_sizes = sorted((len(c) for c in comps), reverse=True)
+        # Connected components (cached: a full V+E traversal per rerun otherwise)
+        comps, comp_sizes, comp_of, top_degree = _components_cached(id(graph), graph)
 
         st.write(f"**Connected components:** {len(comp_sizes)}")
 
@@ -220,29 +581,22 @@ def render_graph_explorer(cleaned_data: Dict[str, list]) -> None:
 
             st.write("Component size distribution (top 10):")
             top_sizes = comp_sizes[:10]
-            st.table({
+            st.dataframe({
                 "Component #": list(range(1, len(top_sizes) + 1)),
                 "Size": top_sizes,
-            })
+            }, hide_index=True)
 
         # Top-degree vertices
         st.markdown("---")
         st.subheader("Most connected developers/publishers in this slice")
 
-        rows = []
-        for v in graph.vertices():
-            rows.append({
-                "label": _vertex_label(v),
-                "degree": graph.degree(v),
-            })
-
-        rows.sort(key=lambda r: r["degree"], reverse=True)
-        top_rows = rows[:15]
-
-        st.table({
-            "Vertex": [r["label"] for r in top_rows],
-            "Degree": [r["degree"] for r in top_rows],
-        })
+        # The top vertices come preselected with the components; only their
+        # labels are built here.
+        st.dataframe({
+            "Vertex": [_vertex_label(v) for _, v in top_degree],
+            "Degree": [deg for deg, _ in top_degree],
+            "Component #": [comp_of[id(v)] for _, v in top_degree],
+        }, hide_index=True)
 
 
 # -------------------------------------------------------------
@@ -256,18 +610,37 @@ def _render_neighbors_table(graph: Graph, v: Graph.Vertex, role: str) -> None:
     `role` is just a string we display ("developer" / "publisher").
     """
 
-    neighbors = []
-    for edge in graph.incident_edges(v):
-        u, w = edge.endpoints()
-        other = w if v is u else u
+    neighbors = _sorted_neighbor_rows(id(graph), v.kind(), v.id(), graph, v)
+
+    if not neighbors:
+        st.info("This vertex has no neighbors in the current graph slice.")
+        return
+
+    st.write(f"Found **{len(neighbors)}** neighbors for this {role}.")
+
+    top = neighbors[:25]
+
+    st.dataframe({
+        "Neighbor": [r["Neighbor"] for r in top],
+        "Role": [r["Role"] for r in top],
+        "Games together": [r["Games together"] for r in top],
+    }, hide_index=True)
 
+
+# The graph is cached, so a vertex's neighbor rows never change: they are
+# built and sorted once per (graph, vertex) and shared by all sessions. The
+# vertex is keyed by (kind, id), unique within a dev/pub graph; max_entries
+# bounds how many opened vertices are kept.
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _sorted_neighbor_rows(graph_id: int, kind: str, vid: int, _graph: Graph, _v: Graph.Vertex) -> list:
+    """Neighbor rows of v, most games together first."""
+    neighbors = []
+    for other, edge in _graph.neighbors(_v):
         row = other.element() or {}
         name = row.get("name") or f"{other.kind()} #{other.id()}"
 
-        data = edge.element() or {}
-        weight = data.get("weight")
-        games = data.get("games")
-        n_games = len(games) if isinstance(games, set) else weight
+        games = edge.element()
+        n_games = len(games) if games is not None else _graph.weight(edge)
 
         neighbors.append({
             "Neighbor": name,
@@ -275,20 +648,62 @@ def _render_neighbors_table(graph: Graph, v: Graph.Vertex, role: str) -> None:
             "Games together": n_games,
         })
 
-    if not neighbors:
-        st.info("This vertex has no neighbors in the current graph slice.")
-        return
+    neighbors.sort(key=itemgetter("Games together"), reverse=True)
+    return neighbors
 
-    st.write(f"Found **{len(neighbors)}** neighbors for this {role}.")
 
-    neighbors.sort(key=lambda r: r["Games together"], reverse=True)
-    top = neighbors[:25]
+def _render_collaborations_table(
+    collabs: List[Tuple[Graph.Vertex, int, Tuple[int, ...]]],
+    title: str = "Collaborations",
+) -> None:
+    if not collabs:
+        st.info("No collaborations found in the current graph slice.")
+        return
 
-    st.table({
-        "Neighbor": [r["Neighbor"] for r in top],
-        "Role": [r["Role"] for r in top],
-        "Games together": [r["Games together"] for r in top],
-    })
+    # get_publisher_collaborations_for_developer is in adjacency order, not
+    # by weight; only the 25 shown rows need ranking (same order as a stable sort)
+    pub_names, weights, unique_games, samples = [], [], [], []
+    for pub_v, weight, games in heapq.nlargest(25, collabs, key=itemgetter(1)):
+        pub_row = pub_v.element() or {}
+        pub_names.append(pub_row.get("name") or f"Publisher #{pub_v.id()}")
+        weights.append(int(weight))
+        unique_games.append(len(games) if games is not None else int(weight))
+
+        sample = ""
+        if games:
+            sample_ids = heapq.nsmallest(10, games)
+            sample = ", ".join(map(str, sample_ids))
+        samples.append(sample)
+
+    st.write(f"**{title}:** {len(collabs)} publisher connections")
+    st.dataframe({
+        "Publisher": pub_names,
+        "Weight (games together)": weights,
+        "Unique games": unique_games,
+        "Sample appids": samples,
+    }, hide_index=True)
+
+
+def _render_full_dataset_table(
+    pub_stats: List[Tuple[int, int, List[int]]],
+    pub_name_by_id: Dict[int, str],
+    title: str,
+) -> None:
+    if not pub_stats:
+        st.info("No publisher collaborations found.")
+        return
+
+    top = pub_stats[:25]
+
+    st.write(f"**{title}:** {len(pub_stats)} publisher connections")
+    st.dataframe({
+        "Publisher": [pub_name_by_id.get(pid, f"Publisher #{pid}") for pid, _, _ in top],
+        "Weight (games together)": [int(weight) for _, weight, _ in top],
+        "Sample appids": [
+            ", ".join(map(str, sample_appids[:10])) if sample_appids else ""
+            for _, _, sample_appids in top
+        ],
+    }, hide_index=True)
 
 
 def _render_traversal(graph: Graph, start: Graph.Vertex, mode: str = "bfs") -> None:
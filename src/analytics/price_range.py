@@ -1,11 +1,35 @@
 # src/analytics/price_range.py
 import streamlit as st
 
+from src.analytics.indexed_engine import HASH_FUNCS, EngineHandle, result_table
 
-def price_range_section(app_engine):
+
+# Rows per page of the results table
+PAGE_SIZE = 50
+
+
+@st.cache_resource(max_entries=256, show_spinner=False, hash_funcs=HASH_FUNCS)
+def _price_range_page(app: EngineHandle, low: float, high: float, page: int):
+    """
+    Memoized AVL range query on 'mat_final_price' for one results page,
+    keyed on (low, high, page). Only PAGE_SIZE records are materialized:
+    the in-order walk stops once the page is full.
+
+    cache_resource (not cache_data) so the page is not pickled and copied
+    on every cache hit; callers only read the returned list.
+    """
+    return app.engine.range_query(
+        "mat_final_price", low, high, limit=PAGE_SIZE, offset=page * PAGE_SIZE
+    )
+
+
+def price_range_section(app: EngineHandle):
     """
     Section 5: price range query using the AVL index on 'mat_final_price'.
     Keeps last results in st.session_state so they don't disappear.
+
+    Ranges entirely outside the precomputed [min, max] of the price column
+    (app.stats) are answered without touching the engine.
     """
     st.divider()
     st.header("5. Range query on price (AVL-based, subset)")
@@ -17,8 +41,8 @@ def price_range_section(app_engine):
         """
     )
 
-    if "price_results" not in st.session_state:
-        st.session_state.price_results = None
+    if "price_count" not in st.session_state:
+        st.session_state.price_count = None
         st.session_state.price_last_range = (None, None)
 
     with st.form("price_range_form"):
@@ -33,39 +57,49 @@ def price_range_section(app_engine):
     if run_price_range:
         if min_price > max_price:
             st.error("Min price cannot be greater than max price.")
-            st.session_state.price_results = None
+            st.session_state.price_count = None
             st.session_state.price_last_range = (None, None)
         else:
             low = float(min_price)
             high = float(max_price)
 
-            with st.spinner("Running AVL-based price range query on the subset..."):
-                results = app_engine.range_query("mat_final_price", low, high)
-
-            st.session_state.price_results = results
+            price_stats = app.stats.get("mat_final_price")
+            if price_stats is not None and (
+                high < price_stats["min"] or low > price_stats["max"]
+            ):
+                # No indexed price can fall in the range: nothing to look up
+                count = 0
+            else:
+                # Only the match count is computed here (O(log n) from the
+                # AVL subtree totals); rows are fetched one page at a time below.
+                count = app.engine.range_count("mat_final_price", low, high)
+            st.session_state.price_count = count
             st.session_state.price_last_range = (low, high)
+            st.session_state.price_page = 1
 
     # Always display last results
-    results = st.session_state.price_results
+    count = st.session_state.price_count
     low, high = st.session_state.price_last_range
 
-    if results is not None and low is not None and high is not None:
-        if not results:
+    if count is not None and low is not None and high is not None:
+        if not count:
             st.warning(
                 f"No applications found with price between {low} and {high} in the "
                 "indexed subset (first 2,000 apps)."
             )
         else:
+            n_pages = (count + PAGE_SIZE - 1) // PAGE_SIZE
             st.success(
-                f"Found {len(results)} application(s) with price between {low} and {high}. "
-                "Showing up to first 50 results:"
+                f"Found {count} application(s) with price between {low} and {high}. "
+                f"Showing {PAGE_SIZE} per page ({n_pages} page(s)):"
             )
+            page = 1
+            if n_pages > 1:
+                page = st.number_input(
+                    "Page:", min_value=1, max_value=n_pages, step=1, key="price_page"
+                )
 
-            rows_to_show = results[:50]
-            table_data = {
-                "appid": [r.get("appid") for r in rows_to_show],
-                "name": [r.get("name") for r in rows_to_show],
-                "price": [r.get("mat_final_price") for r in rows_to_show],
-            }
+            with st.spinner("Running AVL-based price range query on the subset..."):
+                results = _price_range_page(app, low, high, int(page) - 1)
 
-            st.table(table_data)
+            st.dataframe(result_table(results), hide_index=True)
@@ -1,8 +1,22 @@
 # src/analytics/search_by_appid.py
 import streamlit as st
 
+from src.analytics.indexed_engine import HASH_FUNCS, EngineHandle
 
-def search_by_appid_section(app_engine):
+
+@st.cache_data(max_entries=256, show_spinner=False, hash_funcs=HASH_FUNCS)
+def _appid_lookup(app: EngineHandle, appid: int):
+    """
+    Memoized `search_record(appid)`.
+
+    The engine is built once per session by a @st.cache_resource builder and
+    the UI never mutates it, so repeated queries for the same appid can skip
+    the index lookup. The handle is hashed by its precomputed hash_id.
+    """
+    return app.engine.search_record(appid)
+
+
+def search_by_appid_section(app: EngineHandle):
     """
     Section 3: search applications by appid using the indexed engine.
     Uses st.session_state so results stay visible even after other sections run.
@@ -25,7 +39,7 @@ def search_by_appid_section(app_engine):
     )
 
     if st.button("Search by appid", key="btn_search_appid"):
-        results = app_engine.search_record(int(appid_input))
+        results = _appid_lookup(app, int(appid_input))
         st.session_state.appid_results = results
         st.session_state.appid_last_query = int(appid_input)
 
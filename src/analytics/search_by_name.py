@@ -1,8 +1,15 @@
 # src/analytics/search_by_name.py
+import sys
+
 import streamlit as st
 
+from src.analytics.indexed_engine import result_table
+
+# Rows per page of the results table
+PAGE_SIZE = 20
 
-def search_by_name_section(indexed_apps):
+
+def search_by_name_section(name_index):
     """
     Section 4: search applications by name within the indexed subset.
     Uses st.session_state so results stay visible.
@@ -15,7 +22,8 @@ def search_by_name_section(indexed_apps):
         Our DataLoader converts all text columns to lowercase when loading.
         Here we:
           • lowercase the user input,
-          • linearly scan the *same 2,000-row subset* used for the index.
+          • look it up in a name index built once over the *same 2,000-row subset*
+            used for the AVL index.
         """
     )
 
@@ -38,13 +46,11 @@ def search_by_name_section(indexed_apps):
             st.session_state.name_results = None
             st.session_state.name_last_query = ""
         else:
-            normalized = user_query.lower()
-            results = [
-                rec for rec in indexed_apps
-                if rec.get("name") == normalized
-            ]
+            normalized = sys.intern(user_query.lower())
+            results = name_index.get(normalized, [])
             st.session_state.name_results = results
             st.session_state.name_last_query = user_query
+            st.session_state.name_page = 1
 
     # Always show whatever is stored
     results = st.session_state.name_results
@@ -57,16 +63,16 @@ def search_by_name_section(indexed_apps):
                 "in the first 2,000 apps. It may still exist in the full dataset."
             )
         else:
+            n_pages = (len(results) + PAGE_SIZE - 1) // PAGE_SIZE
             st.success(
                 f"Found {len(results)} application(s) with name '{last_q}'. "
-                "Showing up to first 20:"
+                f"Showing {PAGE_SIZE} per page ({n_pages} page(s)):"
             )
+            page = 1
+            if n_pages > 1:
+                page = st.number_input(
+                    "Page:", min_value=1, max_value=n_pages, step=1, key="name_page"
+                )
+            start = (int(page) - 1) * PAGE_SIZE
 
-            rows_to_show = results[:20]
-            table_data = {
-                "appid": [r.get("appid") for r in rows_to_show],
-                "name": [r.get("name") for r in rows_to_show],
-                "price": [r.get("mat_final_price") for r in rows_to_show],
-            }
-
-            st.table(table_data)
+            st.dataframe(result_table(results[start:start + PAGE_SIZE]), hide_index=True)
@@ -17,41 +17,74 @@ def bfs_traversal(graph: Graph, start_vertex):
         order: list of vertices in discovery order.
     """
     visited = set()
-    order = []
     queue = deque()
 
-    visited.add(start_vertex)
-    queue.append(start_vertex)
+    # Bind hot methods to locals: LOAD_FAST instead of attribute lookups
+    # on every iteration of the loop below.
+    neighbors = graph.neighbors
+    visited_add = visited.add
+    popleft = queue.popleft
+    enqueue = queue.append
+
+    # Every vertex is discovered at most once, so the output list can be
+    # allocated up front instead of growing it one append at a time
+    # (at least one slot: start_vertex itself is always reported).
+    order = [None] * max(graph.vertex_count(), 1)
+    idx = 0
+
+    visited_add(start_vertex)
+    enqueue(start_vertex)
 
     while queue:
-        u = queue.popleft()
-        order.append(u)
-        for edge in graph.incident_edges(u):
-            v = graph.opposite(u, edge)
+        u = popleft()
+        order[idx] = u
+        idx += 1
+        for v, _edge in neighbors(u):
             if v not in visited:
-                visited.add(v)
-                queue.append(v)
+                visited_add(v)
+                enqueue(v)
 
-    return order
+    return order[:idx]
 
 
 def dfs_traversal(graph: Graph, start_vertex):
     """
-    Depth-first traversal from start_vertex (recursive).
+    Depth-first traversal from start_vertex.
+
+    Iterative version with an explicit stack of neighbor iterators, so large
+    components do not hit Python's recursion limit. The discovery order is
+    the same as the classic recursive DFS.
     """
-    visited = set()
-    order = []
+    visited = {start_vertex}
+
+    # Local bindings for the hot loop (see bfs_traversal)
+    neighbors = graph.neighbors
+    visited_add = visited.add
+
+    # Preallocated output (see bfs_traversal)
+    order = [None] * max(graph.vertex_count(), 1)
+    order[0] = start_vertex
+    idx = 1
+
+    # One neighbor iterator per vertex on the current DFS path; the top
+    # iterator yields the (neighbor, edge) pairs still to explore
+    stack = [neighbors(start_vertex)]
+    push_iter, pop_iter = stack.append, stack.pop
+
+    while stack:
+        try:
+            v, _edge = next(stack[-1])
+        except StopIteration:
+            pop_iter()
+            continue
 
-    def _dfs(u):
-        visited.add(u)
-        order.append(u)
-        for edge in graph.incident_edges(u):
-            v = graph.opposite(u, edge)
-            if v not in visited:
-                _dfs(v)
+        if v not in visited:
+            visited_add(v)
+            order[idx] = v
+            idx += 1
+            push_iter(neighbors(v))
 
-    _dfs(start_vertex)
-    return order
+    return order[:idx]
 
 
 def shortest_path(graph: Graph, start_vertex, target_vertex):
@@ -70,8 +103,7 @@ def shortest_path(graph: Graph, start_vertex, target_vertex):
 
     while queue:
         u = queue.popleft()
-        for edge in graph.incident_edges(u):
-            v = graph.opposite(u, edge)
+        for v, _edge in graph.neighbors(u):
             if v not in parent:
                 parent[v] = u
                 if v is target_vertex:
@@ -97,22 +129,27 @@ def connected_components(graph: Graph):
     visited = set()
     components = []
 
+    # Local bindings for the hot loop (see bfs_traversal)
+    neighbors = graph.neighbors
+    visited_add = visited.add
+
     for v in graph.vertices():
         if v in visited:
             continue
 
         comp = []
+        comp_append = comp.append
         stack = [v]
-        visited.add(v)
+        push, pop = stack.append, stack.pop
+        visited_add(v)
 
         while stack:
-            u = stack.pop()
-            comp.append(u)
-            for edge in graph.incident_edges(u):
-                w = graph.opposite(u, edge)
+            u = pop()
+            comp_append(u)
+            for w, _edge in neighbors(u):
                 if w not in visited:
-                    visited.add(w)
-                    stack.append(w)
+                    visited_add(w)
+                    push(w)
 
         components.append(comp)
 
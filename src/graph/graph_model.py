@@ -4,22 +4,33 @@
 #
 # This file builds a graph structure representing relationships in the dataset.
 # Example: Developer ↔ Publisher collaborations (weighted by shared apps).
+#
+# Edge weights are kept in one int array indexed by edge iloc
+# (Graph.weight(e)), not inside each edge's element.
 # ===========================================================
 
+from array import array
 from collections import defaultdict
+from itertools import groupby, islice
+
+
+def _pair_key(u_iloc, v_iloc):
+    """One int for an ordered pair of vertex ilocs (edge map key)."""
+    return (u_iloc << 32) | v_iloc
 
 
 class Graph:
     """Adjacency-map based graph (undirected by default)."""
 
     class Vertex:
-        __slots__ = ("_element", "_kind", "_id")
+        __slots__ = ("_element", "_kind", "_id", "_iloc")
 
         def __init__(self, element, kind=None, id_=None):
             # element: usually a dict row from dataset
             self._element = element
             self._kind = kind          # e.g. "developer" or "publisher"
             self._id = id_             # integer id from CSV
+            self._iloc = None          # position in the graph's vertex list
 
         def element(self):
             return self._element
@@ -30,9 +41,8 @@ class Graph:
         def id(self):
             return self._id
 
-        def __hash__(self):
-            # Allows Vertex to be used as dict key / in sets
-            return id(self)
+        # No custom __hash__: the default object hash is already identity
+        # based (and computed in C), so vertices work as dict keys / in sets.
 
         def __repr__(self):
             base = self._element
@@ -44,12 +54,13 @@ class Graph:
             return f"Vertex(kind={self._kind}, id={self._id})"
 
     class Edge:
-        __slots__ = ("_origin", "_destination", "_element")
+        __slots__ = ("_origin", "_destination", "_element", "_iloc")
 
         def __init__(self, u, v, element=None):
             self._origin = u
             self._destination = v
-            self._element = element    # e.g. {"games": set(), "weight": int}
+            self._element = element    # e.g. the shared appids
+            self._iloc = None          # position in the graph's edge list
 
         def endpoints(self):
             return (self._origin, self._destination)
@@ -64,72 +75,297 @@ class Graph:
     # CORE GRAPH STRUCTURE
     # -----------------------------------------------------
 
-    def __init__(self, directed=False):
-        """Create an empty graph (undirected by default)."""
-        self._outgoing = {}
-        # For undirected graphs, incoming == outgoing
-        self._incoming = {} if directed else self._outgoing
+    def __init__(self, directed=False, initial_node_count=0, initial_edge_count=0):
+        """
+        Create an empty graph (undirected by default).
+
+        initial_node_count / initial_edge_count are capacity hints: when the
+        caller knows the sizes up front, the vertex and edge lists are
+        allocated once instead of growing one insert at a time.
+        """
         self._directed = directed
+        # Build-time storage: vertices in insertion order (a vertex's position
+        # is its iloc) and a flat edge list, plus an edge map keyed by the
+        # packed endpoint ilocs, used for duplicate checks and get_edge().
+        # Only the first _n_vertices / _n_edges slots of the (possibly
+        # preallocated) lists are in use.
+        self._vertices = [None] * initial_node_count
+        self._n_vertices = 0
+        self._edges_flat = [None] * initial_edge_count
+        self._n_edges = 0
+        # Per-edge weights as one contiguous int column, indexed by edge
+        # iloc: weight-only code never touches the edge elements.
+        self._edge_weight = array("l", bytes(array("l").itemsize * initial_edge_count))
+        self._edge_index = {}
+        # Adjacency maps are only materialized when a read path needs them
+        # (see _ensure_adj): a list indexed by vertex iloc of
+        # {neighbor iloc: Edge} dicts. For undirected graphs,
+        # incoming == outgoing.
+        self._outgoing = None
+        self._incoming = None
+        # Compressed Sparse Row view of the adjacency, built by freeze()
+        self._csr = None
 
     def is_directed(self):
         return self._directed
 
+    def _ensure_adj(self):
+        """Build the dict-of-dicts adjacency from the edge list (once)."""
+        if self._outgoing is not None:
+            return
+        n = self._n_vertices
+        outgoing = [{} for _ in range(n)]
+        incoming = [{} for _ in range(n)] if self._directed else outgoing
+        for e in self._edge_list():
+            u, v = e._origin._iloc, e._destination._iloc
+            outgoing[u][v] = e
+            incoming[v][u] = e
+        self._outgoing = outgoing
+        self._incoming = incoming
+
+    def _vertex_list(self):
+        """The used part of the vertex list (drops unused preallocated slots)."""
+        verts = self._vertices
+        return verts if self._n_vertices == len(verts) else verts[:self._n_vertices]
+
+    def _edge_list(self):
+        """The used part of the flat edge list."""
+        edges = self._edges_flat
+        return edges if self._n_edges == len(edges) else edges[:self._n_edges]
+
     # ---------- vertex helpers ----------
 
     def vertex_count(self):
-        return len(self._outgoing)
+        return self._n_vertices
 
     def vertices(self):
-        """Iterate over vertices."""
-        return self._outgoing.keys()
+        """
+        List of the vertices, in insertion order. A fresh list, so it can be
+        iterated more than once and sized with len().
+        """
+        return self._vertices[:self._n_vertices]
 
     # ---------- edge helpers ----------
 
     def edge_count(self):
-        total = sum(len(adj) for adj in self._outgoing.values())
-        return total if self._directed else total // 2
+        # Each edge is stored once in the flat list, directed or not
+        return self._n_edges
 
     def edges(self):
-        """Iterate over edges (unique in undirected case)."""
-        result = set()
-        for adj in self._outgoing.values():
-            result.update(adj.values())
-        return result
+        """
+        List of the edges (unique in undirected case), in insertion order.
+
+        A slice of the flat edge list, where every edge is stored exactly
+        once, so no set is needed to de-duplicate. Like vertices(), the
+        result is a fresh, re-iterable list.
+        """
+        return self._edges_flat[:self._n_edges]
+
+    def weight(self, e):
+        """Weight of edge e (1 unless given at insert time)."""
+        return self._edge_weight[e._iloc]
 
     def get_edge(self, u, v):
         """Return edge from u to v, or None."""
-        return self._outgoing.get(u, {}).get(v)
+        e = self._edge_index.get(_pair_key(u._iloc, v._iloc))
+        if e is None and not self._directed:
+            e = self._edge_index.get(_pair_key(v._iloc, u._iloc))
+        return e
 
     def degree(self, v, outgoing=True):
+        if outgoing and self._csr is not None:
+            indptr = self._csr[1]
+            i = v._iloc
+            return indptr[i + 1] - indptr[i]
+        self._ensure_adj()
         adj = self._outgoing if outgoing else self._incoming
-        return len(adj.get(v, {}))
+        return len(adj[v._iloc])
 
     def incident_edges(self, v, outgoing=True):
         """Iterate over edges incident to v."""
+        if outgoing and self._csr is not None:
+            _, indptr, _, edges = self._csr
+            i = v._iloc
+            return iter(edges[indptr[i]:indptr[i + 1]])
+        self._ensure_adj()
         adj = self._outgoing if outgoing else self._incoming
-        for e in adj.get(v, {}).values():
-            yield e
+        return iter(adj[v._iloc].values())
+
+    def neighbors(self, v, outgoing=True):
+        """
+        Iterate over (other_vertex, edge) pairs for the edges incident to v.
+
+        The adjacency is already keyed by the opposite vertex (iloc), so this
+        avoids the endpoints() unpack + `is` test that opposite() needs.
+        """
+        if outgoing and self._csr is not None:
+            verts, indptr, indices, edges = self._csr
+            i = v._iloc
+            lo, hi = indptr[i], indptr[i + 1]
+            return zip(map(verts.__getitem__, indices[lo:hi]), edges[lo:hi])
+        self._ensure_adj()
+        adj = (self._outgoing if outgoing else self._incoming)[v._iloc]
+        return zip(map(self._vertices.__getitem__, adj), adj.values())
+
+    # ---------- CSR (read-optimized) view ----------
+
+    def freeze(self):
+        """
+        Build a Compressed Sparse Row view of the outgoing adjacency.
+
+        The neighbors of the vertex with iloc i are
+        indices[indptr[i]:indptr[i + 1]] (ilocs into the vertex list), with
+        the matching Edge objects at the same positions in a parallel list.
+        degree / incident_edges / neighbors read these contiguous arrays
+        instead of probing per-vertex dicts. Built straight from the flat
+        edge list in two passes: degree counts -> prefix sums -> scatter,
+        so the dict adjacency never has to exist.
+
+        Any later insert drops the CSR view again, so freeze() is meant to be
+        called once the graph is fully built.
+        """
+        verts = self._vertex_list()
+        n = len(verts)
+        directed = self._directed
+        edges_flat = self._edge_list()
+
+        indptr = array("l", bytes(array("l").itemsize * (n + 1)))
+        for e in edges_flat:
+            u, v = e._origin._iloc, e._destination._iloc
+            indptr[u + 1] += 1
+            if not directed and u != v:
+                indptr[v + 1] += 1
+        for i in range(n):
+            indptr[i + 1] += indptr[i]
+
+        m = indptr[n]
+        indices = array("l", bytes(array("l").itemsize * m))
+        edges = [None] * m
+        fill = indptr[:n]  # next free slot per vertex
+        for e in edges_flat:
+            u, v = e._origin._iloc, e._destination._iloc
+            pos = fill[u]
+            indices[pos] = v
+            edges[pos] = e
+            fill[u] = pos + 1
+            if not directed and u != v:
+                pos = fill[v]
+                indices[pos] = u
+                edges[pos] = e
+                fill[v] = pos + 1
+
+        self._csr = (verts, indptr, indices, edges)
+        return self
+
+    def is_frozen(self):
+        return self._csr is not None
 
     # ---------- mutators ----------
 
     def insert_vertex(self, element=None, kind=None, id_=None):
+        self._csr = None
         v = Graph.Vertex(element, kind=kind, id_=id_)
-        self._outgoing[v] = {}
-        if self._directed:
-            self._incoming[v] = {}
+        i = self._n_vertices
+        v._iloc = i
+        if i < len(self._vertices):
+            self._vertices[i] = v
+        else:
+            self._vertices.append(v)
+        self._n_vertices = i + 1
+        if self._outgoing is not None:
+            self._outgoing.append({})
+            if self._directed:
+                self._incoming.append({})
         return v
 
-    def insert_edge(self, u, v, element=None):
-        """Insert an edge between u and v, if it does not already exist."""
-        existing = self.get_edge(u, v)
+    def insert_edge(self, u, v, element=None, weight=1):
+        """
+        Insert an edge between u and v, if it does not already exist
+        (otherwise the existing edge is returned).
+
+        This edge-map probe is the only duplicate check: callers such as
+        build_dev_pub_graph do not keep their own edge lookup table. The
+        pair key is computed once and reused for the probe and the store.
+        """
+        ui, vi = u._iloc, v._iloc
+        key = _pair_key(ui, vi)
+        edge_index = self._edge_index
+        existing = edge_index.get(key)
+        if existing is None and not self._directed:
+            existing = edge_index.get(_pair_key(vi, ui))
         if existing is not None:
             return existing
 
+        self._csr = None
         e = Graph.Edge(u, v, element)
-        self._outgoing[u][v] = e
-        self._incoming[v][u] = e
+        k = self._n_edges
+        e._iloc = k
+        if k < len(self._edges_flat):
+            self._edges_flat[k] = e
+            self._edge_weight[k] = weight
+        else:
+            self._edges_flat.append(e)
+            self._edge_weight.append(weight)
+        self._n_edges = k + 1
+        edge_index[key] = e
+        if self._outgoing is not None:
+            self._outgoing[ui][vi] = e
+            self._incoming[vi][ui] = e
         return e
 
+    def insert_edges_from(self, u, targets):
+        """
+        Batch version of insert_edge for many edges out of one vertex u.
+
+        targets: iterable of (v, element, weight) triples. Existing edges
+        are kept (and returned) exactly like insert_edge does.
+
+        Everything that insert_edge looks up per call — u's iloc, the edge
+        map, the edge/weight columns, u's adjacency dict — is fetched once
+        for the whole batch.
+
+        Returns the list of edges, in target order.
+        """
+        self._csr = None
+        directed = self._directed
+        ui = u._iloc
+        u_key = ui << 32
+        edge_index = self._edge_index
+        index_get = edge_index.get
+        edges_flat = self._edges_flat
+        edge_weight = self._edge_weight
+        capacity = len(edges_flat)
+        k = self._n_edges
+        adj_u = self._outgoing[ui] if self._outgoing is not None else None
+        incoming = self._incoming
+        make_edge = Graph.Edge
+
+        result = []
+        for v, element, weight in targets:
+            vi = v._iloc
+            key = u_key | vi
+            e = index_get(key)
+            if e is None and not directed:
+                e = index_get((vi << 32) | ui)
+            if e is None:
+                e = make_edge(u, v, element)
+                e._iloc = k
+                if k < capacity:
+                    edges_flat[k] = e
+                    edge_weight[k] = weight
+                else:
+                    edges_flat.append(e)
+                    edge_weight.append(weight)
+                k += 1
+                edge_index[key] = e
+                if adj_u is not None:
+                    adj_u[vi] = e
+                    incoming[vi][ui] = e
+            result.append(e)
+
+        self._n_edges = k
+        return result
+
     # ---------- static helper ----------
 
     @staticmethod
@@ -147,6 +383,25 @@ class Graph:
 # Developer–Publisher graph builder
 # =========================================================
 
+def _group_ilocs(link_rows, id_field, id_to_iloc):
+    """
+    Group a link table by appid: {appid: [iloc, ...]}, where iloc is
+    id_to_iloc[row[id_field]]. Rows with no appid or an unknown id are
+    dropped. This is the one loop that touches every link row, so the
+    lookups it repeats per row are bound to locals.
+    """
+    groups = defaultdict(list)
+    get_iloc = id_to_iloc.get
+    for row in link_rows:
+        get = row.get
+        appid = get("appid")
+        iloc = get_iloc(get(id_field))
+        if appid is None or iloc is None:
+            continue
+        groups[appid].append(iloc)
+    return groups
+
+
 def build_dev_pub_graph(cleaned_data):
     """
     Build an undirected bipartite graph between developers and publishers.
@@ -158,84 +413,148 @@ def build_dev_pub_graph(cleaned_data):
         dev_vertices: dict[developer_id -> Vertex]
         pub_vertices: dict[publisher_id -> Vertex]
     """
-    g = Graph(directed=False)
-
     developers = cleaned_data.get("developers", [])
     publishers = cleaned_data.get("publishers", [])
     app_devs = cleaned_data.get("application_developers", [])
     app_pubs = cleaned_data.get("application_publishers", [])
 
-    # --- create vertices ---
-
-    dev_vertices = {}
-    for row in developers:
-        dev_id = row.get("id")
-        if dev_id is None:
-            continue
-        v = g.insert_vertex(element=row, kind="developer", id_=dev_id)
-        dev_vertices[dev_id] = v
-
-    pub_vertices = {}
-    for row in publishers:
-        pub_id = row.get("id")
-        if pub_id is None:
-            continue
-        v = g.insert_vertex(element=row, kind="publisher", id_=pub_id)
-        pub_vertices[pub_id] = v
-
-    # --- group app → devs / pubs ---
-
-    app_to_devs = defaultdict(list)
-    for row in app_devs:
-        appid = row.get("appid")
-        did = row.get("developer_id")
-        if appid is None or did is None:
+    dev_rows = [row for row in developers if row.get("id") is not None]
+    pub_rows = [row for row in publishers if row.get("id") is not None]
+
+    # Intern CSV ids to dense ilocs 0..n-1 (row positions). Everything below
+    # works on these small ints: vertex lookup is a list index and pair keys
+    # are plain int arithmetic. (For a repeated id the last row wins, as the
+    # id -> vertex dicts always did.)
+    dev_iloc = {row["id"]: i for i, row in enumerate(dev_rows)}
+    pub_iloc = {row["id"]: i for i, row in enumerate(pub_rows)}
+
+    # --- group app → dev / pub ilocs (unknown ids are dropped here) ---
+
+    app_to_devs = _group_ilocs(app_devs, "developer_id", dev_iloc)
+    app_to_pubs = _group_ilocs(app_pubs, "publisher_id", pub_iloc)
+
+    # --- aggregate collaborations per (dev, pub) pair ---
+    # All games of a pair are collected first, so each edge is inserted once
+    # with its final data instead of being looked up and patched per game.
+    # Only the games set is built; the weight is derived from it afterwards
+    # (weight == number of shared games), so the loop does one set.add per
+    # link and duplicate link rows cannot inflate the weight.
+
+    # Pairs are keyed by one int, dev_iloc * n_pubs + pub_iloc, instead of
+    # a tuple: no tuple allocation and a cheap int hash per link.
+    # IMPORTANT: developers and publishers are different ID spaces, so the
+    # key is always (dev, pub) — do NOT sort/swap them like an undirected key.
+    n_pubs = len(pub_rows)
+    pair_games = defaultdict(set)  # dev_iloc * n_pubs + pub_iloc -> set of appids
+
+    for appid, dev_ilocs in app_to_devs.items():
+        pub_ilocs = app_to_pubs.get(appid)
+        if not pub_ilocs:
             continue
-        app_to_devs[appid].append(did)
 
-    app_to_pubs = defaultdict(list)
-    for row in app_pubs:
-        appid = row.get("appid")
-        pid = row.get("publisher_id")
-        if appid is None or pid is None:
-            continue
-        app_to_pubs[appid].append(pid)
+        for di in dev_ilocs:
+            dev_key = di * n_pubs
+            for pi in pub_ilocs:
+                pair_games[dev_key + pi].add(appid)
+
+    # The per-app groupings are scratch: release them before the graph
+    # storage is allocated, to keep the build's peak memory down.
+    del app_to_devs, app_to_pubs
+
+    # Both sizes are known now, so the graph storage is allocated once
+    g = Graph(
+        directed=False,
+        initial_node_count=len(dev_rows) + len(pub_rows),
+        initial_edge_count=len(pair_games),
+    )
+
+    # --- create vertices (lists indexed by iloc) ---
+
+    dev_list = [
+        g.insert_vertex(element=row, kind="developer", id_=row["id"])
+        for row in dev_rows
+    ]
+    pub_list = [
+        g.insert_vertex(element=row, kind="publisher", id_=row["id"])
+        for row in pub_rows
+    ]
 
     # --- insert edges for collaborations ---
 
-    edge_lookup = {}  # (dev_id, pub_id) -> Edge
+    # Edge element = the shared appids as a sorted tuple; weight = how many
+    # there are (the weight column of the graph, see Graph.weight).
+    # The sets above were only needed for dedup while filling; once a pair
+    # is complete its size is final, so it is stored in an exactly sized
+    # tuple instead of a hash table with spare capacity (most edges have
+    # only a game or two, which a set would still give 8+ slots).
+    #
+    # Sorted pair keys come out grouped by developer (key = dev * n_pubs +
+    # pub), so each developer's edges go in as one insert_edges_from batch.
+    for di, keys in groupby(sorted(pair_games), key=lambda k: k // n_pubs):
+        dev_base = di * n_pubs
+        g.insert_edges_from(
+            dev_list[di],
+            (
+                (pub_list[key - dev_base], tuple(sorted(games)), len(games))
+                for key in keys
+                for games in (pair_games[key],)
+            ),
+        )
+
+    # Same for the pair map — drop it before freeze() allocates the CSR
+    # arrays.
+    del pair_games
+
+    # Public id -> Vertex maps (the builder's return contract)
+    dev_vertices = {dev_id: dev_list[i] for dev_id, i in dev_iloc.items()}
+    pub_vertices = {pub_id: pub_list[i] for pub_id, i in pub_iloc.items()}
+
+    # The graph is read-only from here on: switch reads to the CSR arrays
+    g.freeze()
 
-    for appid, dev_ids in app_to_devs.items():
-        pub_ids = app_to_pubs.get(appid, [])
-        if not pub_ids:
-            continue
+    return g, dev_vertices, pub_vertices
 
-        for did in dev_ids:
-            if did not in dev_vertices:
-                continue
-            for pid in pub_ids:
-                if pid not in pub_vertices:
-                    continue
-
-                # IMPORTANT: dev_id and pub_id are in different ID spaces,
-                # so do NOT sort/mix them.
-                key = (did, pid)
-
-                if key not in edge_lookup:
-                    u = dev_vertices[did]
-                    v = pub_vertices[pid]
-                    edge_data = {"games": {appid}, "weight": 1}
-                    e = g.insert_edge(u, v, element=edge_data)
-                    edge_lookup[key] = e
-                else:
-                    e = edge_lookup[key]
-                    data = e.element() or {}
-                    data.setdefault("games", set()).add(appid)
-                    data["weight"] = int(data.get("weight", 0)) + 1
-                    # ensure edge still points at updated dict
-                    e._element = data  # (safe here since Edge stores dict)
 
-    return g, dev_vertices, pub_vertices
+def dev_pub_slice(cleaned_data, max_devs=150, max_pubs=150, max_links=5000):
+    """
+    A small subset of cleaned_data for build_dev_pub_graph: the first
+    max_devs developers and max_pubs publishers, plus up to max_links rows
+    of each link table.
+
+    The link rows are not just the first max_links rows of each table (those
+    rarely share an appid, which left the slice with hardly any edges). They
+    are only rows that can become an edge: a known developer/publisher on an
+    app that also has a link on the other side.
+    """
+    developers = cleaned_data.get("developers", [])[:max_devs]
+    publishers = cleaned_data.get("publishers", [])[:max_pubs]
+    dev_ids = {row.get("id") for row in developers}
+    pub_ids = {row.get("id") for row in publishers}
+    dev_ids.discard(None)
+    pub_ids.discard(None)
+
+    pub_links = [
+        row for row in cleaned_data.get("application_publishers", [])
+        if row.get("publisher_id") in pub_ids and row.get("appid") is not None
+    ]
+    pub_apps = {row["appid"] for row in pub_links}
+
+    app_devs = list(islice(
+        (
+            row for row in cleaned_data.get("application_developers", [])
+            if row.get("developer_id") in dev_ids and row.get("appid") in pub_apps
+        ),
+        max_links,
+    ))
+    dev_apps = {row["appid"] for row in app_devs}
+    app_pubs = [row for row in pub_links if row["appid"] in dev_apps][:max_links]
+
+    return {
+        "developers": developers,
+        "publishers": publishers,
+        "application_developers": app_devs,
+        "application_publishers": app_pubs,
+    }
 
 
 def developer_with_most_publisher_collaborations(graph, dev_vertices):
@@ -247,13 +566,11 @@ def developer_with_most_publisher_collaborations(graph, dev_vertices):
     """
     max_dev = None
     max_weight = -1
+    weight = graph.weight
 
     for dev in dev_vertices.values():
-        total = 0
         # incident_edges(dev) gives all edges connected to this dev
-        for edge in graph.incident_edges(dev):
-            data = edge.element() or {}
-            total += int(data.get("weight", 0))
+        total = sum(map(weight, graph.incident_edges(dev)))
 
         if total > max_weight:
             max_weight = total
@@ -265,19 +582,20 @@ def developer_with_most_publisher_collaborations(graph, dev_vertices):
 def get_publisher_collaborations_for_developer(graph, developer_vertex):
     """
     Returns a list of tuples:
-       (publisher_vertex, weight, game_ids_set)
+       (publisher_vertex, weight, game_ids)
+
+    game_ids is the edge element: the shared appids (a sorted tuple for
+    graphs from build_dev_pub_graph).
     """
     results = []
 
-    for edge in graph.incident_edges(developer_vertex):
-        other = graph.opposite(developer_vertex, edge)
+    for other, edge in graph.neighbors(developer_vertex):
         # Only publishers should be returned (bipartite safety)
         if hasattr(other, "kind") and other.kind() != "publisher":
             continue
 
-        data = edge.element() or {}
-        weight = int(data.get("weight", 0))
-        games = data.get("games", set())
+        weight = graph.weight(edge)
+        games = edge.element() or ()
         results.append((other, weight, games))
 
     return results
@@ -19,7 +19,7 @@
 
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, List, Optional
 
 
 from src.storage.data_store import DataStore
@@ -91,26 +91,10 @@ class QueryEngine:
 
         :return: True if at least one record was updated, False otherwise.
         """
-        updated_any = False
-        # We rely on the AVL index to find matching records quickly
-        matches = self.store.search_by_attr(self.key_attribute, key)
-
-        if not matches:
-            return False
-
-        # We need internal record IDs to call DataStore.update_record.
-        # We derive them by scanning the raw storage once.
-        for record_id, rec in enumerate(self.store.records):
-            if rec is None:
-                continue
-            if rec.get(self.key_attribute) == key:
-                # Construct updated record
-                new_rec = dict(rec)
-                new_rec[field] = value
-                self.store.update_record(record_id, new_rec)
-                updated_any = True
-
-        return updated_any
+        # The AVL index gives the internal record IDs directly; the batch
+        # update then touches each affected index key only once.
+        record_ids = self.store.search_ids_by_attr(self.key_attribute, key)
+        return self.store.bulk_update(record_ids, field, value) > 0
 
     # ---------------------------------------------------------
     # DELETE
@@ -121,30 +105,35 @@ class QueryEngine:
 
         :return: True if at least one record was deleted, False otherwise.
         """
-        deleted_any = False
-        # Use the index to know whether matches exist
-        matches = self.store.search_by_attr(self.key_attribute, key)
-        if not matches:
-            return False
-
-        # Then iterate over raw storage to find and delete by internal ID
-        for record_id, rec in enumerate(self.store.records):
-            if rec is None:
-                continue
-            if rec.get(self.key_attribute) == key:
-                ok = self.store.delete_record(record_id)
-                deleted_any = deleted_any or ok
-
-        return deleted_any
+        # The AVL index gives the internal record IDs directly; the batch
+        # delete then touches each affected index key only once.
+        record_ids = self.store.search_ids_by_attr(self.key_attribute, key)
+        return self.store.bulk_delete(record_ids) > 0
 
     # ---------------------------------------------------------
     # RANGE QUERY (DELEGATED)
     # ---------------------------------------------------------
-    def range_query(self, attr: str, low: Any, high: Any) -> List[dict]:
+    def range_query(
+        self,
+        attr: str,
+        low: Any,
+        high: Any,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[dict]:
         """
         Delegate a range query to the underlying DataStore.
+        `limit`/`offset` select one page of the key-ordered result.
 
         Example:
             engine.range_query("price", 10, 30)
+            engine.range_query("price", 10, 30, limit=50, offset=100)
         """
-        return self.store.range_query(attr, low, high)
+        return self.store.range_query(attr, low, high, limit=limit, offset=offset)
+
+    def range_count(self, attr: str, low: Any, high: Any) -> int:
+        """
+        Number of records with low <= record[attr] <= high (no records are
+        materialized; O(log n) on an AVL-indexed attribute).
+        """
+        return self.store.range_count(attr, low, high)
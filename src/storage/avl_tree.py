@@ -5,107 +5,237 @@
 # 2. Implement insert(), delete(), search() functions
 # 3. Add rotations (LL, RR, LR, RL) to keep balance
 # 4. Include in_order() traversal for debugging and range queries
+# 5. Augment nodes with subtree totals for O(log n) range counts
+# 6. Recycle deleted nodes through a bounded pool (fewer allocations)
 # Purpose: Ensure O(log n) performance for data lookups and updates.
 
+
+def node_weight(value):
+    """
+    How much a node counts towards its subtree `total`: the number of
+    items for a container value (e.g. a DataStore id set), 1 otherwise.
+    """
+    if isinstance(value, (dict, list, set, tuple)):
+        return len(value)
+    return 1
+
+
 class AVLNode:
+    # Fixed attribute set: no per-node __dict__, faster attribute access
+    __slots__ = ("key", "value", "height", "total", "left", "right")
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
         self.height = 1
+        # Sum of node_weight(value) over this subtree (order-statistic
+        # augmentation, kept up to date by every structural change)
+        self.total = node_weight(value)
         self.left = None
         self.right = None
 
 
 class AVLTree:
 
-    def insert(self, root, key, value):
-        if not root:
-            return AVLNode(key, value)
-        elif key < root.key:
-            root.left = self.insert(root.left, key, value)
-        else:
-            root.right = self.insert(root.right, key, value)
-
-        # FIXED: removed extra parenthesis
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-        balance = self.get_balance(root)
+    # Max number of recycled nodes a tree keeps, so a large delete burst
+    # cannot pin memory.
+    POOL_LIMIT = 1 << 16
 
-        # Left Left
-        if balance > 1 and key < root.left.key:
-            return self.right_rotate(root)
-
-        # Right Right
-        if balance < -1 and key > root.right.key:
-            return self.left_rotate(root)
-
-        # Left Right
-        if balance > 1 and key > root.left.key:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
+    def __init__(self):
+        # Nodes unlinked by delete() are kept here and reused by insert().
+        # The pool is per tree: it is freed with the tree and never shared
+        # between trees (or threads working on different trees).
+        self._pool = []
 
-        # Right Left
-        if balance < -1 and key < root.right.key:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
-
-        return root
+    def _new_node(self, key, value):
+        pool = self._pool
+        if not pool:
+            return AVLNode(key, value)
+        node = pool.pop()
+        node.key = key
+        node.value = value
+        node.height = 1
+        node.total = node_weight(value)
+        node.left = node.right = None
+        return node
+
+    def _release_node(self, node):
+        pool = self._pool
+        if len(pool) < self.POOL_LIMIT:
+            # Drop references so pooled nodes do not keep values alive
+            node.key = node.value = node.left = node.right = None
+            pool.append(node)
+
+    # Insert/delete are iterative: the descent records the visited nodes
+    # (and which child it took) in a list, and the rebalancing pass walks
+    # that list backwards, re-attaching each subtree's (possibly rotated)
+    # root to its parent. No Python frame per tree level.
 
+    def insert(self, root, key, value):
+        path = []
+        went_left = []
+        node = root
+        while node is not None:
+            path.append(node)
+            # Equal keys go right (duplicates allowed)
+            go_left = key < node.key
+            went_left.append(go_left)
+            node = node.left if go_left else node.right
+
+        return self._rebuild(path, went_left, self._new_node(key, value))
+
+    def insert_or_merge(self, root, key, value, merge):
+        """
+        Insert `key` with `value`, or, if `key` is already in the tree, set
+        that node's value to merge(old_value, value).
+
+        One descent instead of search() followed by insert() (or by
+        refresh_totals() when the key exists); totals along the path are
+        fixed on the way back up. Returns the (possibly new) root.
+        """
+        path = []
+        went_left = []
+        node = root
+        while node is not None:
+            node_key = node.key
+            if key == node_key:
+                node.value = merge(node.value, value)
+                return self._rebuild(path, went_left, self._rebalance(node))
+            path.append(node)
+            go_left = key < node_key
+            went_left.append(go_left)
+            node = node.left if go_left else node.right
+
+        return self._rebuild(path, went_left, self._new_node(key, value))
+
+    def _rebuild(self, path, went_left, subtree):
+        """
+        Hang `subtree` where the descent along `path` ended, then rebalance
+        every node on `path` bottom-up, re-attaching each (possibly rotated)
+        subtree to its parent. Returns the new root.
+        """
+        for node, go_left in zip(reversed(path), reversed(went_left)):
+            if go_left:
+                node.left = subtree
+            else:
+                node.right = subtree
+            subtree = self._rebalance(node)
+        return subtree
 
     def delete(self, root, key):
-        if not root:
-            return root
-
-        elif key < root.key:
-            root.left = self.delete(root.left, key)
-
-        elif key > root.key:
-            root.right = self.delete(root.right, key)
-
+        return self._delete(root, key, None)
+
+    def delete_or_update(self, root, key, update):
+        """
+        Set the value of the node with `key` to update(old_value); if the
+        result is empty (falsy), remove the node instead.
+
+        One descent instead of search() followed by delete() (or by
+        refresh_totals() when the node stays); heights/totals along the path
+        are fixed and rotations done on the way back up. Returns the
+        (possibly new) root. A missing key leaves the tree unchanged.
+        """
+        return self._delete(root, key, update)
+
+    def _delete(self, root, key, update):
+        """delete() when `update` is None, else delete_or_update()."""
+        path = []
+        went_left = []
+        node = root
+        while node is not None:
+            node_key = node.key
+            if key == node_key:
+                break
+            path.append(node)
+            go_left = key < node_key
+            went_left.append(go_left)
+            node = node.left if go_left else node.right
         else:
-            if not root.left:
-                return root.right
-            elif not root.right:
-                return root.left
-
-            temp = self.get_min_value_node(root.right)
-            root.key = temp.key
-            root.value = temp.value
-            root.right = self.delete(root.right, temp.key)
-
-        if not root:
             return root
 
-        # FIXED
-        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
-        balance = self.get_balance(root)
-
-        # Left Left
-        if balance > 1 and self.get_balance(root.left) >= 0:
-            return self.right_rotate(root)
-
-        # Left Right
-        if balance > 1 and self.get_balance(root.left) < 0:
-            root.left = self.left_rotate(root.left)
+        if update is not None:
+            value = update(node.value)
+            if value:
+                node.value = value
+                subtree = self._rebalance(node)
+            else:
+                subtree = self._remove_node(node)
+        else:
+            subtree = self._remove_node(node)
+
+        return self._rebuild(path, went_left, subtree)
+
+    def _remove_node(self, root):
+        """Unlink `root` from its subtree; returns the subtree's new root."""
+        if not root.left:
+            child = root.right
+            self._release_node(root)
+            return child
+        elif not root.right:
+            child = root.left
+            self._release_node(root)
+            return child
+
+        temp = self.get_min_value_node(root.right)
+        root.key = temp.key
+        root.value = temp.value
+        root.right = self.delete(root.right, temp.key)
+        return self._rebalance(root)
+
+    def _rebalance(self, root):
+        """
+        Update root's height/total and rotate if a change below it left it
+        unbalanced. Returns the subtree's new root.
+
+        The rotation case is chosen from the child's balance rather than by
+        comparing keys, so it is the same for insert and delete and stays
+        correct with duplicate keys.
+        """
+        # Heights / balances computed inline: no get_height / get_balance
+        # method calls on the hot path
+        left, right = root.left, root.right
+        hl = left.height if left is not None else 0
+        hr = right.height if right is not None else 0
+        root.height = 1 + (hl if hl > hr else hr)
+        root.total = (
+            node_weight(root.value)
+            + (left.total if left is not None else 0)
+            + (right.total if right is not None else 0)
+        )
+        balance = hl - hr
+
+        if balance > 1:
+            ll, lr = left.left, left.right
+            left_balance = (ll.height if ll is not None else 0) - (lr.height if lr is not None else 0)
+            # Left Left
+            if left_balance >= 0:
+                return self.right_rotate(root)
+            # Left Right
+            root.left = self.left_rotate(left)
             return self.right_rotate(root)
 
-        # Right Right
-        if balance < -1 and self.get_balance(root.right) <= 0:
-            return self.left_rotate(root)
-
-        # Right Left
-        if balance < -1 and self.get_balance(root.right) > 0:
-            root.right = self.right_rotate(root.right)
+        if balance < -1:
+            rl, rr = right.left, right.right
+            right_balance = (rl.height if rl is not None else 0) - (rr.height if rr is not None else 0)
+            # Right Right
+            if right_balance <= 0:
+                return self.left_rotate(root)
+            # Right Left
+            root.right = self.right_rotate(right)
             return self.left_rotate(root)
 
         return root
 
 
     def search(self, root, key):
-        if not root or root.key == key:
-            return root
-        if key < root.key:
-            return self.search(root.left, key)
-        return self.search(root.right, key)
+        # Iterative descent: no Python frame per level
+        node = root
+        while node is not None:
+            node_key = node.key
+            if node_key == key:
+                return node
+            node = node.left if key < node_key else node.right
+        return None
 
 
     def left_rotate(self, z):
@@ -115,8 +245,20 @@ class AVLTree:
         y.left = z
         z.right = T2
 
-        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        zl = z.left
+        hl = zl.height if zl is not None else 0
+        hr = T2.height if T2 is not None else 0
+        z.height = hz = 1 + (hl if hl > hr else hr)
+        yr = y.right
+        hr = yr.height if yr is not None else 0
+        y.height = 1 + (hz if hz > hr else hr)
+
+        # y's subtree now holds exactly what z's held before the rotation
+        y.total, z.total = z.total, (
+            node_weight(z.value)
+            + (zl.total if zl is not None else 0)
+            + (T2.total if T2 is not None else 0)
+        )
 
         return y
 
@@ -128,8 +270,20 @@ class AVLTree:
         y.right = z
         z.left = T3
 
-        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        zr = z.right
+        hl = T3.height if T3 is not None else 0
+        hr = zr.height if zr is not None else 0
+        z.height = hz = 1 + (hl if hl > hr else hr)
+        yl = y.left
+        hl = yl.height if yl is not None else 0
+        y.height = 1 + (hl if hl > hz else hz)
+
+        # y's subtree now holds exactly what z's held before the rotation
+        y.total, z.total = z.total, (
+            node_weight(z.value)
+            + (T3.total if T3 is not None else 0)
+            + (zr.total if zr is not None else 0)
+        )
 
         return y
 
@@ -150,6 +304,118 @@ class AVLTree:
         return root
 
 
+    def build_from_sorted(self, items):
+        """
+        Build a perfectly balanced AVL tree from `items`, a list of
+        (key, value) pairs sorted by key with no duplicate keys.
+
+        The middle item becomes the root and both halves are built
+        recursively, so no rotations are needed: O(n) instead of
+        n separate O(log n) inserts with rebalancing.
+        """
+        def build(lo, hi):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            key, value = items[mid]
+            node = self._new_node(key, value)
+            node.left = left = build(lo, mid)
+            node.right = right = build(mid + 1, hi)
+            node.height = 1 + max(self.get_height(left), self.get_height(right))
+            node.total += (left.total if left else 0) + (right.total if right else 0)
+            return node
+
+        return build(0, len(items))
+
+
+    # ---------- subtree totals ----------
+
+    def refresh_totals(self, root, key):
+        """
+        Recompute `total` along the search path to `key`.
+
+        Call this after changing the size of an existing node's value in
+        place (e.g. adding a record id to a key that is already indexed);
+        structural changes (insert/delete/rotations) maintain totals
+        themselves.
+        """
+        path = []
+        node = root
+        while node is not None:
+            path.append(node)
+            node_key = node.key
+            if node_key == key:
+                break
+            node = node.left if key < node_key else node.right
+
+        for node in reversed(path):
+            left, right = node.left, node.right
+            node.total = (
+                node_weight(node.value)
+                + (left.total if left is not None else 0)
+                + (right.total if right is not None else 0)
+            )
+
+    def _total_below(self, root, bound, inclusive):
+        """Sum of node weights for keys < bound (<= bound if inclusive)."""
+        total = 0
+        node = root
+        while node is not None:
+            key = node.key
+            if key < bound or (inclusive and key == bound):
+                left = node.left
+                total += node_weight(node.value) + (left.total if left is not None else 0)
+                node = node.right
+            else:
+                node = node.left
+        return total
+
+    def range_total(self, root, low, high):
+        """
+        Sum of node weights for keys in [low, high] in O(log n), from the
+        subtree totals, without visiting the nodes in between.
+        """
+        if root is None or high < low:
+            return 0
+        return (
+            self._total_below(root, high, inclusive=True)
+            - self._total_below(root, low, inclusive=False)
+        )
+
+    def rank(self, root, key):
+        """Sum of node weights for keys strictly below `key` (O(log n))."""
+        return self._total_below(root, key, inclusive=False)
+
+    def select(self, root, rank):
+        """
+        Locate the item at position `rank` (0-based, counting node weights
+        in key order) in O(log n) using the subtree totals.
+
+        Returns (node, index, stack) - the node holding that item, the
+        item's index within node.value, and the ancestors whose key follows
+        node's (the pending stack of an in-order walk resumed after node)
+        - or None if rank is out of range.
+        """
+        if rank < 0 or root is None or rank >= root.total:
+            return None
+
+        stack = []
+        node = root
+        while node is not None:
+            left = node.left
+            left_total = left.total if left is not None else 0
+            if rank < left_total:
+                stack.append(node)
+                node = left
+                continue
+            rank -= left_total
+            weight = node_weight(node.value)
+            if rank < weight:
+                return node, rank, stack
+            rank -= weight
+            node = node.right
+        return None
+
     def in_order(self, root):
         res = []
         if root:
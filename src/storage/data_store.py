@@ -7,7 +7,9 @@
 # 4. Expose methods to get or modify data through indexes
 # Purpose: Link raw data with AVL trees for efficient access.
 
-from collections import deque
+from array import array
+from itertools import compress
+from operator import itemgetter
 
 # Flexible import so this module works both inside the package (src.storage)
 # and as a standalone file for testing.
@@ -17,46 +19,159 @@ except ImportError:  # running directly / in tests
     from avl_tree import AVLTree
 
 
+def _id_map(value) -> dict:
+    """
+    Normalise an index node value to an insertion-ordered {record_id: None}
+    dict (a list or a single id is converted).
+
+    A dict keeps the IDs in insertion order like a list would, but adding
+    and removing one ID is O(1) instead of a list scan.
+    """
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, list):
+        return dict.fromkeys(value)
+    return {value: None}
+
+
+def _merge_ids(value, new_ids: dict) -> dict:
+    """AVLTree.insert_or_merge callback: add new_ids to a node's id dict."""
+    ids = _id_map(value)
+    ids.update(new_ids)
+    return ids
+
+
+# Exact-match lookups on an AVL-indexed attribute switch to a dict snapshot
+# of the index after this many lookups without an intervening write.
+SNAPSHOT_AFTER_READS = 32
+
+
+class _IdQueue:
+    """
+    FIFO queue of record IDs stored as C longs in an array.array.
+
+    Only append/extend at the back and popleft at the front are needed.
+    popleft advances a head index; the consumed prefix is dropped once it
+    is at least half of the buffer, so both ends are amortized O(1) and
+    queued IDs take 8 bytes each instead of a boxed int per deque slot.
+    """
+
+    __slots__ = ("_buf", "_head")
+
+    def __init__(self, ids=()):
+        self._buf = array("l", ids)
+        self._head = 0
+
+    def append(self, record_id: int) -> None:
+        self._buf.append(record_id)
+
+    def extend(self, record_ids) -> None:
+        self._buf.extend(record_ids)
+
+    def popleft(self) -> int:
+        buf, head = self._buf, self._head
+        if head >= len(buf):
+            raise IndexError("pop from an empty queue")
+        record_id = buf[head]
+        head += 1
+        if head * 2 >= len(buf):
+            del buf[:head]
+            head = 0
+        self._head = head
+        return record_id
+
+    def __len__(self) -> int:
+        return len(self._buf) - self._head
+
+    def __iter__(self):
+        buf = self._buf
+        return (buf[i] for i in range(self._head, len(buf)))
+
+
 class DataStore:
     """
     In-memory storage + AVL-based secondary indexes.
 
     - Raw records are stored in a list (self.records).
       The position in the list is the internal record_id.
-    - For each indexed attribute, we maintain an AVL tree that maps:
-        key -> list[record_id]
+    - For each indexed attribute, we maintain an index that maps:
+        key -> {record_id: None}   (insertion-ordered set of record_ids)
+      Range-indexed attributes use an AVL tree (ordered keys, range
+      queries); the other indexed attributes only ever need exact-match
+      lookups and use a plain dict (hash index) instead.
 
     The data store itself is intentionally low-level:
     it does NOT parse user queries. That is handled by the query engine
     (src.query_engine.query_handler).
     """
 
-    def __init__(self, index_attributes: list, reuse_free_slots: bool = True):
+    def __init__(
+        self,
+        index_attributes: list,
+        reuse_free_slots: bool = True,
+        range_attributes: list | None = None,
+    ):
         """
-        :param index_attributes: list of fields to index with AVL Trees.
+        :param index_attributes: list of fields to index.
                Example: ["id", "name"]
         :param reuse_free_slots:
              - True  -> reuse IDs of deleted records (default)
              - False -> always append new records and never reuse freed IDs
+        :param range_attributes: the subset of index_attributes that needs
+               range queries; these get AVL trees. The rest get hash
+               indexes (O(1) exact match). None (default) -> all indexed
+               attributes are range-indexed with AVL trees.
         """
         # Raw record storage. Deleted records become None.
         self.records: list[dict | None] = []
 
-        # Which attributes are indexed with AVL trees
+        # Which attributes are indexed (AVL or hash)
         self.index_attributes = list(index_attributes)
 
-        # One AVLTree per indexed attribute
+        if range_attributes is None:
+            range_attributes = self.index_attributes
+        unknown = [a for a in range_attributes if a not in self.index_attributes]
+        if unknown:
+            raise ValueError(f"Range attributes {unknown} are not in index_attributes.")
+        self.range_attributes = [a for a in self.index_attributes if a in range_attributes]
+
+        # One AVLTree per range-indexed attribute
         self.indexes: dict[str, AVLTree] = {
-            attr: AVLTree() for attr in self.index_attributes
+            attr: AVLTree() for attr in self.range_attributes
         }
 
         # Root node for each AVL index
         self.roots: dict[str, object | None] = {
-            attr: None for attr in self.index_attributes
+            attr: None for attr in self.range_attributes
+        }
+
+        # Hash index (key -> {record_id: None}) for every other indexed attribute
+        self.hash_indexes: dict[str, dict] = {
+            attr: {} for attr in self.index_attributes
+            if attr not in self.indexes
         }
 
-        # Queue of IDs that have been deleted and can optionally be reused
-        self.free_ids: deque[int] = deque()
+        # Read-mostly fast path for AVL attributes: a {key: {record_id: None}}
+        # snapshot of the tree serves exact matches with one dict get. Any
+        # write to the attribute's index drops it (see _invalidate_snapshot).
+        self._snapshots: dict[str, dict] = {}
+        self._reads_since_write: dict[str, int] = {
+            attr: 0 for attr in self.range_attributes
+        }
+
+        # (attr, index) pairs for the per-record insert/delete loops, so they
+        # do not re-resolve self.indexes[attr] / self.hash_indexes[attr]
+        self._hash_pairs: list[tuple[str, dict]] = list(self.hash_indexes.items())
+        self._tree_pairs: list[tuple[str, AVLTree]] = [
+            (attr, self.indexes[attr]) for attr in self.range_attributes
+        ]
+
+        # Queue of IDs that have been deleted and can optionally be reused.
+        # _free_set holds the IDs that are really free: update_record can
+        # revive a freed slot in O(1) by discarding it from the set, and the
+        # stale queue entry is skipped when it reaches the front.
+        self.free_ids = _IdQueue()
+        self._free_set: set[int] = set()
 
         # Whether to reuse freed IDs when inserting
         self.reuse_free_slots: bool = reuse_free_slots
@@ -80,31 +195,231 @@ class DataStore:
                 raise KeyError(f"Record missing indexed attribute '{attr}'")
 
         # Decide which slot to use
-        if self.reuse_free_slots and self.free_ids:
-            record_id = self.free_ids.popleft()
+        if self.reuse_free_slots and self._free_set:
+            record_id = self._take_free_id()
             self.records[record_id] = record
         else:
             record_id = len(self.records)
             self.records.append(record)
 
-        # Update each AVL index
-        for attr in self.index_attributes:
+        # Update each index (the _index_add logic, inlined with local
+        # bindings: this is the per-record hot path)
+        for attr, hash_index in self._hash_pairs:
             key = record[attr]
+            ids = hash_index.get(key)
+            if ids is None:
+                hash_index[key] = {record_id: None}
+            else:
+                ids[record_id] = None
+
+        roots = self.roots
+        for attr, tree in self._tree_pairs:
+            self._invalidate_snapshot(attr)
+            roots[attr] = tree.insert_or_merge(
+                roots[attr], record[attr], {record_id: None}, _merge_ids
+            )
+
+        return record_id
+
+    # ---------------------------------------------------------
+    # FREE SLOT HELPERS
+    # ---------------------------------------------------------
+    def _free_id(self, record_id: int) -> None:
+        """Queue a deleted slot for reuse."""
+        self.free_ids.append(record_id)
+        self._free_set.add(record_id)
+
+    def _take_free_id(self) -> int | None:
+        """Oldest freed ID that is still free (stale entries are dropped), or None."""
+        free_ids, free_set = self.free_ids, self._free_set
+        while free_ids:
+            record_id = free_ids.popleft()
+            if record_id in free_set:
+                free_set.discard(record_id)
+                return record_id
+        return None
+
+    # ---------------------------------------------------------
+    # INDEX MAINTENANCE HELPERS
+    # ---------------------------------------------------------
+    def _lookup(self, attr: str, key):
+        """The {record_id: None} dict stored under `key`, or None."""
+        hash_index = self.hash_indexes.get(attr)
+        if hash_index is not None:
+            return hash_index.get(key)
+
+        snapshot = self._snapshots.get(attr)
+        if snapshot is not None:
+            return snapshot.get(key)
+
+        # Build the snapshot (one in-order walk) once the index has been
+        # read often enough since its last write to pay for it
+        reads = self._reads_since_write[attr] + 1
+        if reads >= SNAPSHOT_AFTER_READS:
+            snapshot = self._snapshots[attr] = {
+                node_key: _id_map(ids)
+                for node_key, ids in self.indexes[attr].in_order(self.roots[attr])
+            }
+            return snapshot.get(key)
+        self._reads_since_write[attr] = reads
+
+        node = self.indexes[attr].search(self.roots[attr], key)
+        return _id_map(node.value) if node else None
+
+    def _invalidate_snapshot(self, attr: str) -> None:
+        """Called on every write to the AVL index of `attr`."""
+        self._snapshots.pop(attr, None)
+        self._reads_since_write[attr] = 0
+
+    def _index_add(self, attr: str, key, record_id: int) -> None:
+        """Add record_id under `key` in the index of `attr`."""
+        self._index_add_many(attr, key, (record_id,))
+
+    def _index_add_many(self, attr: str, key, record_ids) -> None:
+        """Add several record_ids under one key with a single lookup."""
+        hash_index = self.hash_indexes.get(attr)
+        if hash_index is not None:
+            ids = hash_index.get(key)
+            if ids is None:
+                hash_index[key] = dict.fromkeys(record_ids)
+            else:
+                ids.update(dict.fromkeys(record_ids))
+            return
+
+        self._invalidate_snapshot(attr)
+
+        # One descent: merge into the existing node or insert a new one;
+        # assign the (possibly changed) root
+        self.roots[attr] = self.indexes[attr].insert_or_merge(
+            self.roots[attr], key, dict.fromkeys(record_ids), _merge_ids
+        )
+
+    def _index_remove(self, attr: str, key, record_id: int) -> None:
+        """Remove record_id from `key` in the index of `attr`; drop empty keys."""
+        self._index_remove_many(attr, key, (record_id,))
+
+    def _index_remove_many(self, attr: str, key, record_ids) -> None:
+        """Remove several record_ids from one key with a single lookup."""
+        hash_index = self.hash_indexes.get(attr)
+        if hash_index is not None:
+            ids = hash_index.get(key)
+            if ids is not None:
+                for record_id in record_ids:
+                    ids.pop(record_id, None)
+                if not ids:
+                    del hash_index[key]
+            return
+
+        def drop_ids(value):
+            ids = _id_map(value)
+            for record_id in record_ids:
+                ids.pop(record_id, None)
+            return ids
+
+        self._invalidate_snapshot(attr)
+
+        # One descent: shrink the node's id dict, or, if it becomes empty,
+        # remove the key from the AVL tree
+        self.roots[attr] = self.indexes[attr].delete_or_update(
+            self.roots[attr], key, drop_ids
+        )
+
+    # ---------------------------------------------------------
+    # BULK INSERT
+    # ---------------------------------------------------------
+    def bulk_insert(self, records) -> list[int]:
+        """
+        Insert many records at once.
+
+        Slots are assigned exactly like insert_record would (freed IDs
+        first, if enabled), but instead of one AVL insert per record and
+        attribute, each index is rebuilt once: the (key, record_id) pairs
+        are sorted, merged with the keys already in the tree, and turned
+        into a balanced tree bottom-up (AVLTree.build_from_sorted).
+
+        A rebuild costs O(n + m) for m new records into an index of n ids,
+        so when the batch is small (m * log2(n) < n) the records are merged
+        into the existing tree one by one instead (O(m log n)); otherwise
+        many small batches into a large store would be quadratic.
+
+        :param records: iterable of dicts with all indexed attributes present
+        :return: list of internal record_ids, in input order
+        """
+        records = list(records)
+
+        for record in records:
+            for attr in self.index_attributes:
+                if attr not in record:
+                    raise KeyError(f"Record missing indexed attribute '{attr}'")
+
+        # Assign slots: reuse freed IDs first, then append the rest at once
+        record_ids: list[int] = []
+        if self.reuse_free_slots:
+            for record in records:
+                if not self._free_set:
+                    break
+                record_id = self._take_free_id()
+                self.records[record_id] = record
+                record_ids.append(record_id)
+        n_reused = len(record_ids)
+
+        start = len(self.records)
+        self.records.extend(records[n_reused:])
+        record_ids.extend(range(start, len(self.records)))
+
+        # Hash indexes: one dict probe per record, nothing to rebuild
+        for attr, hash_index in self.hash_indexes.items():
+            get = hash_index.get
+            for record_id, record in zip(record_ids, records):
+                key = record[attr]
+                ids = get(key)
+                if ids is None:
+                    hash_index[key] = {record_id: None}
+                else:
+                    ids[record_id] = None
+
+        # Rebuild each AVL index once from sorted (key, {record_ids}) items.
+        # The old nodes are discarded, so their ID dicts can be reused.
+        for attr in self.range_attributes:
             tree = self.indexes[attr]
             root = self.roots[attr]
 
-            node = tree.search(root, key)
-            if node:
-                # node.value is usually a list of record IDs
-                if isinstance(node.value, list):
-                    node.value.append(record_id)
+            indexed = root.total if root is not None else 0
+            if len(records) * indexed.bit_length() < indexed:
+                self._invalidate_snapshot(attr)
+                for record_id, record in zip(record_ids, records):
+                    root = tree.insert_or_merge(
+                        root, record[attr], {record_id: None}, _merge_ids
+                    )
+                self.roots[attr] = root
+                continue
+
+            existing = [
+                (key, _id_map(ids))
+                for key, ids in tree.in_order(self.roots[attr])
+            ]
+            new_pairs = [
+                (record[attr], {record_id: None})
+                for record_id, record in zip(record_ids, records)
+            ]
+            # Stable sort: for equal keys, existing IDs stay before new ones
+            pairs = sorted(existing + new_pairs, key=itemgetter(0))
+
+            items = []
+            for key, ids in pairs:
+                if items and items[-1][0] == key:
+                    items[-1][1].update(ids)
                 else:
-                    node.value = [node.value, record_id]
-            else:
-                # Insert new node; assign the (possibly changed) root
-                self.roots[attr] = tree.insert(root, key, [record_id])
+                    items.append((key, ids))
 
-        return record_id
+            self.roots[attr] = tree.build_from_sorted(items)
+
+            # The sorted items are exactly the snapshot _lookup would build:
+            # a freshly bulk-loaded store serves exact matches from a dict
+            self._snapshots[attr] = dict(items)
+            self._reads_since_write[attr] = 0
+
+        return record_ids
 
     # ---------------------------------------------------------
     # LOOKUP HELPERS
@@ -116,69 +431,170 @@ class DataStore:
         if attr not in self.index_attributes:
             raise ValueError(f"Attribute '{attr}' is not indexed.")
 
-        tree = self.indexes[attr]
-        root = self.roots[attr]
-
-        node = tree.search(root, key)
-        if not node:
+        ids = self._lookup(attr, key)
+        if not ids:
             return []
 
-        ids = node.value if isinstance(node.value, list) else [node.value]
-        # Filter out ids that are out of range or already deleted
-        return [
-            rid for rid in ids
-            if 0 <= rid < len(self.records) and self.records[rid] is not None
-        ]
+        # Skip deleted slots. Indexed IDs always point into self.records
+        # (see range_query), so the check runs in C: compress keeps the IDs
+        # whose record is truthy (live records are non-empty dicts).
+        return list(compress(ids, map(self.records.__getitem__, ids)))
 
     # ---------------------------------------------------------
     # LOOKUP EXACT VALUE (PUBLIC)
     # ---------------------------------------------------------
+    def search_ids_by_attr(self, attr: str, key) -> list[int]:
+        """
+        Returns the internal record_ids where record[attr] == key,
+        straight from the index (no scan of self.records).
+        """
+        return self._get_ids_for_attr(attr, key)
+
+    def iter_by_attr(self, attr: str, key):
+        """
+        Lazily yields the records where record[attr] == key.
+        Same lookup as search_by_attr, without building the result list.
+        """
+        if attr not in self.index_attributes:
+            raise ValueError(f"Attribute '{attr}' is not indexed.")
+
+        ids = self._lookup(attr, key)
+        if not ids:
+            return
+
+        # Same C-level gather as range_query
+        yield from filter(None, map(self.records.__getitem__, ids))
+
     def search_by_attr(self, attr: str, key):
         """
         Returns list of records where record[attr] == key.
-        Uses AVL index for fast lookup.
+        Uses the attribute's index (hash or AVL) for fast lookup.
         """
-        ids = self._get_ids_for_attr(attr, key)
-        return [self.records[rid] for rid in ids]
+        return list(self.iter_by_attr(attr, key))
 
     # ---------------------------------------------------------
     # RANGE QUERY
     # ---------------------------------------------------------
-    def range_query(self, attr: str, low, high):
+    def range_query(self, attr: str, low, high, limit: int | None = None, offset: int = 0):
         """
-        Returns all records where low <= record[attr] <= high.
+        Returns all records where low <= record[attr] <= high, in key order.
         Uses in-order traversal of the AVL index to only visit relevant keys.
+
+        With `limit`, only the page records[offset:offset + limit] of that
+        result is returned, and the walk stops as soon as the page is
+        complete (use range_count for the total).
+
+        Hash-indexed attributes have no key order, so for them every key is
+        checked and the matching keys are sorted (slower; declare the
+        attribute in range_attributes if it is range-queried often).
         """
         if attr not in self.index_attributes:
             raise ValueError(f"Attribute '{attr}' is not indexed.")
 
-        tree = self.indexes[attr]
-        root = self.roots[attr]
         result_ids: list[int] = []
-
-        def traverse(node):
-            if not node:
-                return
-            # Only explore left subtree if there may be keys >= low
-            if node.key > low:
-                traverse(node.left)
-            if low <= node.key <= high:
-                if isinstance(node.value, list):
-                    result_ids.extend(node.value)
+        extend = result_ids.extend
+        append = result_ids.append
+        # Number of IDs after which the requested page is complete
+        stop = None if limit is None else offset + limit
+
+        hash_index = self.hash_indexes.get(attr)
+        if hash_index is not None:
+            for key in sorted(k for k in hash_index if low <= k <= high):
+                extend(hash_index[key])
+                if stop is not None and len(result_ids) >= stop:
+                    break
+            return self._gather(result_ids, offset, stop)
+
+        # Iterative in-order walk with an explicit stack, so results stay in
+        # key order. Subtrees that cannot hold keys in [low, high] are never
+        # pushed, and the walk stops at the first key above `high`.
+        stack: list = []
+        node = self.roots[attr]
+
+        if offset:
+            # Jump straight to the first record of the page instead of
+            # walking over `offset` records: rank(low) + offset is the
+            # page start's position in key order, and select() finds it in
+            # O(log n) from the subtree totals, returning the walk's stack.
+            tree = self.indexes[attr]
+            found = tree.select(node, tree.rank(node, low) + offset)
+            if found is None or found[0].key > high:
+                return []
+            node, index, stack = found
+            value = node.value
+            if isinstance(value, (dict, list)):
+                extend(list(value)[index:])
+            else:
+                append(value)
+            node = node.right
+            offset, stop = 0, limit
+
+        push, pop = stack.append, stack.pop
+
+        while True:
+            while node is not None:
+                key = node.key
+                if key < low:
+                    # node and its left subtree are below the range
+                    node = node.right
+                elif key == low:
+                    # nothing in the left subtree can be >= low
+                    push(node)
+                    node = None
                 else:
-                    result_ids.append(node.value)
-            # Only explore right subtree if there may be keys <= high
-            if node.key < high:
-                traverse(node.right)
-
-        traverse(root)
-
-        # Map IDs to records, skipping deleted slots
-        return [
-            self.records[rid]
-            for rid in result_ids
-            if 0 <= rid < len(self.records) and self.records[rid] is not None
-        ]
+                    push(node)
+                    node = node.left
+
+            if not stack:
+                break
+
+            node = pop()
+            if node.key > high:
+                break
+
+            value = node.value
+            if isinstance(value, (dict, list)):
+                extend(value)
+            else:
+                append(value)
+            if stop is not None and len(result_ids) >= stop:
+                break
+            node = node.right
+
+        return self._gather(result_ids, offset, stop)
+
+    def _gather(self, result_ids: list, offset: int = 0, stop: int | None = None) -> list:
+        """
+        Records for result_ids[offset:stop], skipping deleted slots.
+
+        IDs in an index always point into self.records (delete/update
+        unindex them first), so the gather can run in C via map();
+        filter(None) drops the None slots (indexed records always have
+        fields, so they are never falsy).
+        """
+        if offset or stop is not None:
+            result_ids = result_ids[offset:stop]
+        return list(filter(None, map(self.records.__getitem__, result_ids)))
+
+    # ---------------------------------------------------------
+    # RANGE COUNT
+    # ---------------------------------------------------------
+    def range_count(self, attr: str, low, high) -> int:
+        """
+        Number of records where low <= record[attr] <= high, without
+        materializing them.
+
+        For AVL-indexed attributes this is O(log n): every node carries the
+        number of record ids in its subtree (AVLTree.range_total).
+        """
+        if attr not in self.index_attributes:
+            raise ValueError(f"Attribute '{attr}' is not indexed.")
+
+        hash_index = self.hash_indexes.get(attr)
+        if hash_index is not None:
+            return sum(len(ids) for key, ids in hash_index.items() if low <= key <= high)
+
+        return self.indexes[attr].range_total(self.roots[attr], low, high)
 
     # ---------------------------------------------------------
     # DELETE RECORD
@@ -200,36 +616,25 @@ class DataStore:
         if record is None:
             return False
 
-        # Remove from indexes
-        for attr in self.index_attributes:
+        # Remove from indexes (hash part of _index_remove inlined, see
+        # insert_record)
+        for attr, hash_index in self._hash_pairs:
             key = record[attr]
-            tree = self.indexes[attr]
-            root = self.roots[attr]
-
-            node = tree.search(root, key)
-            if node:
-                # Remove id from node.value
-                if isinstance(node.value, list):
-                    if record_id in node.value:
-                        node.value.remove(record_id)
-                else:
-                    if node.value == record_id:
-                        node.value = []
+            ids = hash_index.get(key)
+            if ids is not None:
+                ids.pop(record_id, None)
+                if not ids:
+                    del hash_index[key]
 
-                # If node becomes empty → remove key from AVL
-                node_empty = (
-                    not node.value or
-                    (isinstance(node.value, list) and len(node.value) == 0)
-                )
-                if node_empty:
-                    self.roots[attr] = tree.delete(root, key)
+        for attr in self.range_attributes:
+            self._index_remove(attr, record[attr], record_id)
 
         # Mark slot as deleted
         self.records[record_id] = None
 
         # Add to free pool only if reuse is enabled
         if self.reuse_free_slots:
-            self.free_ids.append(record_id)
+            self._free_id(record_id)
 
         return True
 
@@ -244,6 +649,9 @@ class DataStore:
         - Write the new record into the same slot
         - Reinsert into AVL indexes
 
+        Indexed attributes whose value did not change are left alone in
+        their index (no remove + reinsert).
+
         This keeps the record_id stable for external references.
         """
         if record_id < 0 or record_id >= len(self.records):
@@ -255,54 +663,115 @@ class DataStore:
                 raise KeyError(f"Updated record missing indexed attribute '{attr}'")
 
         old_record = self.records[record_id]
-        if old_record is not None:
-            # Remove old record from indexes
-            for attr in self.index_attributes:
-                old_key = old_record[attr]
-                tree = self.indexes[attr]
-                root = self.roots[attr]
-
-                node = tree.search(root, old_key)
-                if node:
-                    if isinstance(node.value, list):
-                        if record_id in node.value:
-                            node.value.remove(record_id)
-                    else:
-                        if node.value == record_id:
-                            node.value = []
-
-                    node_empty = (
-                        not node.value or
-                        (isinstance(node.value, list) and len(node.value) == 0)
-                    )
-                    if node_empty:
-                        self.roots[attr] = tree.delete(root, old_key)
+        if old_record is None:
+            changed = self.index_attributes
+        else:
+            changed = [
+                attr for attr in self.index_attributes
+                if old_record[attr] != new_record[attr]
+            ]
+            # Remove old record from the indexes whose key changes
+            for attr in changed:
+                self._index_remove(attr, old_record[attr], record_id)
 
         # Overwrite the slot with new record
         self.records[record_id] = new_record
 
-        # If this id accidentally exists in free_ids, remove it
-        try:
-            self.free_ids.remove(record_id)
-        except ValueError:
-            pass
+        # The slot is live again: un-free it in O(1); its queue entry
+        # becomes stale and is skipped by _take_free_id
+        self._free_set.discard(record_id)
 
         # Re-insert into indexes
+        for attr in changed:
+            self._index_add(attr, new_record[attr], record_id)
+
+        return True
+
+    # ---------------------------------------------------------
+    # BULK MODIFY / DELETE
+    # ---------------------------------------------------------
+    def _group_by_key(self, attr: str, record_ids) -> dict:
+        """Group live record_ids by their current value of `attr`."""
+        groups: dict = {}
+        records = self.records
+        for record_id in record_ids:
+            groups.setdefault(records[record_id][attr], []).append(record_id)
+        return groups
+
+    def bulk_update(self, record_ids, field: str, value) -> int:
+        """
+        Set record[field] = value on many records at once.
+
+        Each record is replaced by an updated copy in the same slot (as
+        update_record does), but the indexes are only touched where a key
+        actually changes: if `field` is not indexed, no index work is done;
+        otherwise the IDs are grouped by old key, so every old key is
+        searched once and the new key is searched once.
+
+        :param record_ids: internal IDs; invalid or deleted ones are skipped
+        :return: number of records updated
+        """
+        records = self.records
+        n = len(records)
+        live = [
+            rid for rid in dict.fromkeys(record_ids)
+            if 0 <= rid < n and records[rid] is not None
+        ]
+        if not live:
+            return 0
+
+        if field in self.index_attributes:
+            groups = self._group_by_key(field, live)
+            moved = []
+            for old_key, ids in groups.items():
+                if old_key == value:
+                    continue
+                self._index_remove_many(field, old_key, ids)
+                moved.extend(ids)
+
+            if moved:
+                self._index_add_many(field, value, moved)
+
+        for rid in live:
+            new_rec = dict(records[rid])
+            new_rec[field] = value
+            records[rid] = new_rec
+
+        return len(live)
+
+    def bulk_delete(self, record_ids) -> int:
+        """
+        Delete many records at once.
+
+        Same effect as calling delete_record for each ID, but for every
+        index the IDs are grouped by key first, so each affected key is
+        searched (and, if it becomes empty, deleted) only once.
+
+        :param record_ids: internal IDs; invalid or deleted ones are skipped
+        :return: number of records deleted
+        """
+        records = self.records
+        n = len(records)
+        live = [
+            rid for rid in dict.fromkeys(record_ids)
+            if 0 <= rid < n and records[rid] is not None
+        ]
+        if not live:
+            return 0
+
         for attr in self.index_attributes:
-            key = new_record[attr]
-            tree = self.indexes[attr]
-            root = self.roots[attr]
+            for key, ids in self._group_by_key(attr, live).items():
+                self._index_remove_many(attr, key, ids)
 
-            node = tree.search(root, key)
-            if node:
-                if isinstance(node.value, list):
-                    node.value.append(record_id)
-                else:
-                    node.value = [node.value, record_id]
-            else:
-                self.roots[attr] = tree.insert(root, key, [record_id])
+        for rid in live:
+            records[rid] = None
 
-        return True
+        # Add to free pool only if reuse is enabled
+        if self.reuse_free_slots:
+            self.free_ids.extend(live)
+            self._free_set.update(live)
+
+        return len(live)
 
     # ---------------------------------------------------------
     # GET RECORD BY ID
@@ -9,11 +9,11 @@ def main():
     print(f"Loaded {len(genres)} genres.")
 
     # Use reuse_free_slots=True to reuse deleted IDs (set False to always append)
-    store = DataStore(index_attributes=["id", "name"])
+    # "id" gets an AVL index (range query below); "name" is equality-only
+    store = DataStore(index_attributes=["id", "name"], range_attributes=["id"])
 
-    # Insert all genres
-    for record in genres:
-        store.insert_record(record)
+    # Insert all genres at once: each index is built from sorted keys
+    store.bulk_insert(genres)
     print("Inserted into DataStore.")
 
     print("\n=== Search by name 'strategy' ===")
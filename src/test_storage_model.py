@@ -0,0 +1,163 @@
+# src/test_storage_model.py
+# Differential tests: AVLTree and DataStore are driven with random operations
+# and checked against a brute-force model (plain dicts and list scans).
+# Run with: python -m pytest -q
+import random
+
+import pytest
+
+from src.storage.avl_tree import AVLTree, node_weight
+from src.storage.data_store import DataStore, _merge_ids
+
+SEEDS = range(8)
+
+
+def _check_tree(node, low=None, high=None):
+    """Checks BST order, heights, AVL balance and subtree totals; returns height."""
+    if node is None:
+        return 0
+    assert low is None or node.key > low
+    assert high is None or node.key < high
+    left = _check_tree(node.left, low, node.key)
+    right = _check_tree(node.right, node.key, high)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    left_total = node.left.total if node.left is not None else 0
+    right_total = node.right.total if node.right is not None else 0
+    assert node.total == left_total + node_weight(node.value) + right_total
+    return node.height
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_avl_tree_matches_model(seed):
+    rng = random.Random(seed)
+    tree = AVLTree()
+    root = None
+    model = {}  # key -> {id: None}, in insertion order
+    next_id = 0
+
+    for _ in range(600):
+        op = rng.random()
+        key = rng.randint(0, 60)
+        if op < 0.55:
+            root = tree.insert_or_merge(root, key, {next_id: None}, _merge_ids)
+            model.setdefault(key, {})[next_id] = None
+            next_id += 1
+        elif op < 0.85 and model.get(key):
+            victim = rng.choice(list(model[key]))
+
+            def drop(value, victim=victim):
+                value.pop(victim, None)
+                return value
+
+            root = tree.delete_or_update(root, key, drop)
+            del model[key][victim]
+            if not model[key]:
+                del model[key]
+        else:
+            root = tree.delete(root, key)
+            model.pop(key, None)
+
+        _check_tree(root)
+
+    assert [(k, list(v)) for k, v in tree.in_order(root)] == [
+        (k, list(model[k])) for k in sorted(model)
+    ]
+
+    for _ in range(50):
+        low, high = sorted((rng.randint(-5, 65), rng.randint(-5, 65)))
+        expected = sum(len(v) for k, v in model.items() if low <= k <= high)
+        assert tree.range_total(root, low, high) == expected
+        assert tree.rank(root, low) == sum(len(v) for k, v in model.items() if k < low)
+
+    flat = [(k, i) for k in sorted(model) for i in model[k]]
+    for rank, (key, record_id) in enumerate(flat):
+        node, index, _ = tree.select(root, rank)
+        assert node.key == key and list(node.value)[index] == record_id
+    assert tree.select(root, len(flat)) is None
+
+
+def _random_record(rng):
+    return {"price": rng.randint(0, 40), "cat": rng.choice("abcde"), "n": rng.random()}
+
+
+def _check_store(store, model, rng):
+    live = [(rid, rec) for rid, rec in model.items()]
+
+    for attr in ("price", "cat"):
+        values = {rec[attr] for _, rec in live} | {"zz", -1}
+        # Repeat exact lookups so AVL attributes also go through the snapshot
+        for value in list(values) * 2:
+            expected = sorted(rid for rid, rec in live if rec[attr] == value)
+            assert sorted(store.search_ids_by_attr(attr, value)) == expected
+            assert sorted(map(id, store.search_by_attr(attr, value))) == sorted(
+                id(model[rid]) for rid in expected
+            )
+
+    for attr, bounds in (("price", (-2, 42)), ("cat", ("a", "e"))):
+        for _ in range(15):
+            if attr == "price":
+                low, high = sorted((rng.randint(*bounds), rng.randint(*bounds)))
+            else:
+                low, high = sorted((rng.choice("abcdef"), rng.choice("abcdef")))
+
+            full = store.range_query(attr, low, high)
+            expected = [rec for _, rec in live if low <= rec[attr] <= high]
+            assert sorted(map(id, full)) == sorted(map(id, expected))
+            keys = [rec[attr] for rec in full]
+            assert keys == sorted(keys)
+            assert store.range_count(attr, low, high) == len(expected)
+
+            limit = rng.randint(1, 7)
+            pages = []
+            for offset in range(0, len(full) + limit, limit):
+                pages.extend(store.range_query(attr, low, high, limit=limit, offset=offset))
+            assert list(map(id, pages)) == list(map(id, full))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_data_store_matches_model(seed):
+    rng = random.Random(seed)
+    store = DataStore(index_attributes=["price", "cat"], range_attributes=["price"])
+    model = {}  # record_id -> record, live records only
+
+    record_ids = store.bulk_insert([_random_record(rng) for _ in range(200)])
+    model.update(zip(record_ids, store.records))
+
+    for step in range(300):
+        op = rng.random()
+        if op < 0.3:
+            record = _random_record(rng)
+            model[store.insert_record(record)] = record
+        elif op < 0.4:
+            batch = [_random_record(rng) for _ in range(rng.choice((2, 150)))]
+            model.update(zip(store.bulk_insert(batch), batch))
+        elif op < 0.6 and model:
+            rid = rng.choice(list(model))
+            assert store.delete_record(rid)
+            del model[rid]
+        elif op < 0.75 and model:
+            rid = rng.choice(list(model))
+            record = dict(model[rid], price=rng.randint(0, 40))
+            assert store.update_record(rid, record)
+            model[rid] = record
+        elif op < 0.85 and model:
+            rids = rng.sample(list(model), min(len(model), 5))
+            value = rng.randint(0, 40)
+            assert store.bulk_update(rids, "price", value) == len(rids)
+            for rid in rids:
+                model[rid] = store.records[rid]
+                assert model[rid]["price"] == value
+        elif model:
+            rids = rng.sample(list(model), min(len(model), 5))
+            assert store.bulk_delete(rids) == len(rids)
+            for rid in rids:
+                del model[rid]
+
+        if step % 50 == 0:
+            _check_store(store, model, rng)
+
+    for rid, rec in enumerate(store.records):
+        assert rec is model.get(rid)
+    _check_tree(store.roots["price"])
+    _check_store(store, model, rng)
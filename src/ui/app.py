@@ -26,17 +26,20 @@ from src.analytics.graph_explorer import render_graph_explorer
 
 
 # === Cached helpers ===
-@st.cache_data
+@st.cache_resource
 def load_clean_data():
     """
     Load and clean all CSVs using DataLoader + SCHEMAS.
 
     This is the *expensive* CSV loading step (reading all CSV files, typing
-    columns, lowercasing strings, etc.). Streamlit's @st.cache_data makes
-    sure we only do it once per code change.
+    columns, lowercasing strings, etc.). Two cache layers:
+    - on disk (data/.cache, keyed by CSV mtimes + schemas), so a restarted
+      app unpickles the cleaned tables instead of re-parsing the CSVs;
+    - @st.cache_resource, so every rerun/session in this process shares one
+      object instead of getting a fresh copy (sections only read it).
     """
     loader = DataLoader(SCHEMAS)
-    cleaned = loader.load_all("data")  # assumes /data folder in project root
+    cleaned = loader.load_all_cached("data")  # assumes /data folder in project root
     return cleaned
 
 
@@ -68,19 +71,19 @@ st.success("Data loaded successfully! 🎉")
 show_dataset_status(cleaned_data)
 
 # 3) Section 2 – build indexed engine (and get objects for later sections)
-app_engine, indexed_apps = build_indexed_engine_section(cleaned_data)
+app_handle = build_indexed_engine_section(cleaned_data)
 
 # 4) Section 3 – search by appid
-search_by_appid_section(app_engine)
+search_by_appid_section(app_handle)
 
 # 5) Section 4 – search by name
-search_by_name_section(indexed_apps)
+search_by_name_section(app_handle.name_index)
 
 # 6) Section 5 – price range query
-price_range_section(app_engine)
+price_range_section(app_handle)
 
 # 7) Section 6 – basic analytics
-basic_analytics_section(indexed_apps)
+basic_analytics_section(app_handle.stats)
 
 
 render_graph_explorer(cleaned_data)
@@ -8,7 +8,29 @@
 # Purpose: Prepare clean, ready-to-use data for the MiniDB system.
 
 import csv
+import hashlib
 import os
+import pickle
+import sys
+
+# Bump when clean_record / clean_value change what they produce, so stale
+# on-disk caches (see load_all_cached) are not reused.
+CACHE_FORMAT_VERSION = 3
+
+# Text columns whose cleaned (lowercased) values are interned: names repeat
+# across rows and are compared/looked up a lot, so equal names share one
+# str object and equality checks short-circuit on identity.
+INTERNED_COLUMNS = frozenset({"name"})
+
+# Many-to-many link tables: a repeated (appid, id) row carries no extra
+# information, so load_table keeps only the first occurrence of each row.
+DEDUPLICATED_TABLES = frozenset({
+    "application_categories",
+    "application_developers",
+    "application_genres",
+    "application_platforms",
+    "application_publishers",
+})
 
 class DataLoader:
     """
@@ -29,20 +51,19 @@ class DataLoader:
 
     def clean_value(self, raw, converter):
         """Converts string → correct type."""
-        if raw is None or raw.strip() == "":
+        if raw is None:
             return self.missing_default
 
         raw = raw.strip()
+        if not raw:
+            return self.missing_default
+
+        if converter is str:
+            return raw.lower()
 
         try:
-            if converter == int:
-                return int(raw)
-            if converter == float:
-                return float(raw)
-            if converter == str:
-                return raw.lower()
             return converter(raw)
-        except:
+        except (ValueError, TypeError):
             return self.missing_default
 
     def clean_record(self, file_key, record: dict):
@@ -52,10 +73,129 @@ class DataLoader:
 
         for col, conv in schema.items():
             raw = record.get(col)
-            clean[col] = self.clean_value(raw, conv)
+            value = self.clean_value(raw, conv)
+            if col in INTERNED_COLUMNS and isinstance(value, str):
+                value = sys.intern(value)
+            clean[col] = value
+
+        return clean
+
+    def column_cleaner(self, col, converter):
+        """
+        Single-argument cleaner for one column, equivalent to clean_value
+        (plus interning for INTERNED_COLUMNS) but with the converter
+        dispatch resolved once per column instead of once per cell.
+        """
+        default = self.missing_default
+
+        if converter is int or converter is float:
+            def clean(raw):
+                raw = raw.strip()
+                if not raw:
+                    return default
+                try:
+                    return converter(raw)
+                except ValueError:
+                    return default
+        elif converter is str:
+            if col in INTERNED_COLUMNS:
+                intern = sys.intern
+
+                def clean(raw):
+                    raw = raw.strip()
+                    return intern(raw.lower()) if raw else default
+            else:
+                def clean(raw):
+                    raw = raw.strip()
+                    return raw.lower() if raw else default
+        else:
+            clean_value = self.clean_value
+            interned = col in INTERNED_COLUMNS
+
+            def clean(raw):
+                value = clean_value(raw, converter)
+                if interned and isinstance(value, str):
+                    value = sys.intern(value)
+                return value
 
         return clean
 
+    def row_builder(self, columns):
+        """
+        Compiles the row-cleaning function for one file layout:
+        columns is [(col, position, cleaner)] and the result is equivalent to
+        lambda row: {col: cleaner(row[position]) for col, position, cleaner in columns}
+        but with the loop unrolled, so each row is one dict display.
+        A position of None (column absent from the file) always yields the
+        missing default.
+        """
+        namespace = {"missing_default": self.missing_default}
+        items = []
+        for n, (col, i, clean) in enumerate(columns):
+            if i is None:
+                items.append(f"{col!r}: missing_default")
+                continue
+            namespace[f"clean_{n}"] = clean
+            items.append(f"{col!r}: clean_{n}(row[{i}])")
+
+        exec(f"def clean_row(row):\n    return {{{', '.join(items)}}}\n", namespace)
+        return namespace["clean_row"]
+
+    def load_table(self, file_key, filepath: str):
+        """
+        Reads and cleans one CSV with csv.reader. Produces the same rows as
+        clean_record over load_csv, without a DictReader dict per raw row;
+        for DEDUPLICATED_TABLES repeated rows are dropped.
+        """
+        with open(filepath, "r", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return []
+
+            # Last occurrence wins for duplicate headers, as with DictReader
+            positions = {name: i for i, name in enumerate(header)}
+            width = len(header)
+
+            clean_row = self.row_builder([
+                (col, positions.get(col), self.column_cleaner(col, conv))
+                for col, conv in self.schemas[file_key].items()
+            ])
+            padding = [""] * width
+            dedupe = file_key in DEDUPLICATED_TABLES
+            seen = set()
+
+            rows = []
+            append = rows.append
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    row = row + padding[len(row):]
+                cleaned = clean_row(row)
+                if dedupe:
+                    key = tuple(cleaned.values())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                append(cleaned)
+            return rows
+
+    @staticmethod
+    def intern_columns(cleaned_data: dict) -> None:
+        """Intern the INTERNED_COLUMNS values of every row, in place."""
+        intern = sys.intern
+        for rows in cleaned_data.values():
+            if not rows:
+                continue
+            # Rows of one table share the schema's columns
+            cols = [col for col in INTERNED_COLUMNS if col in rows[0]]
+            for col in cols:
+                for row in rows:
+                    value = row[col]
+                    if isinstance(value, str):
+                        row[col] = intern(value)
+
     def load_all(self, folder_path: str):
         """
         Loads and cleans every CSV in the /data folder.
@@ -74,11 +214,73 @@ class DataLoader:
                 continue
 
             filepath = os.path.join(folder_path, filename)
-            cleaned_data[file_key] = []
+            cleaned_data[file_key] = self.load_table(file_key, filepath)
+
+        return cleaned_data
+
+    def cache_key(self, folder_path: str) -> str:
+        """
+        Fingerprint of everything load_all's output depends on: the name,
+        size and mtime of every CSV in the folder, the schemas, the
+        missing-value default and CACHE_FORMAT_VERSION.
+        """
+        parts = [str(CACHE_FORMAT_VERSION), repr(self.missing_default)]
+
+        for filename in sorted(os.listdir(folder_path)):
+            if not filename.endswith(".csv"):
+                continue
+            st = os.stat(os.path.join(folder_path, filename))
+            parts.append(f"{filename}:{st.st_size}:{st.st_mtime_ns}")
+
+        for file_key in sorted(self.schemas):
+            schema = self.schemas[file_key]
+            cols = ",".join(f"{col}={getattr(conv, '__name__', conv)}" for col, conv in schema.items())
+            parts.append(f"{file_key}({cols})")
+
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def load_all_cached(self, folder_path: str, cache_dir: str | None = None):
+        """
+        Same result as load_all, memoized on disk.
+
+        The cleaned tables are pickled to <cache_dir>/<cache_key>.pkl
+        (default cache_dir: <folder_path>/.cache). As long as no CSV or
+        schema changes, a fresh process unpickles them instead of parsing
+        and cleaning every CSV again. Older cache files are removed.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(folder_path, ".cache")
+
+        key = self.cache_key(folder_path)
+        cache_path = os.path.join(cache_dir, f"{key}.pkl")
+
+        try:
+            with open(cache_path, "rb") as f:
+                cleaned_data = pickle.load(f)
+            # Unpickled strings are not interned; restore what clean_record did
+            self.intern_columns(cleaned_data)
+            return cleaned_data
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            print(f"[WARN] Ignoring unreadable cache {cache_path}: {e}")
+
+        cleaned_data = self.load_all(folder_path)
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temp file and rename, so a crash never leaves a
+            # truncated cache behind
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(cleaned_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
 
-            for row in self.load_csv(filepath):
-                clean_row = self.clean_record(file_key, row)
-                cleaned_data[file_key].append(clean_row)
+            for filename in os.listdir(cache_dir):
+                if filename.endswith(".pkl") and filename != f"{key}.pkl":
+                    os.remove(os.path.join(cache_dir, filename))
+        except OSError as e:
+            print(f"[WARN] Could not write data cache to {cache_dir}: {e}")
 
         return cleaned_data
 